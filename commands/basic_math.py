@@ -1,8 +1,12 @@
 """
 Basic mathematical operations and utilities.
 """
+import time
 from .base_command import BaseCommand
+from core.polynomial import to_polynomial, describe_ring, factor_polynomial
+from core.simplifier import budgeted_simplify, MEASURES
 from utils.exceptions import CommandError
+from utils.validation import InputValidator
 from sympy import nsimplify
 from decimal import getcontext
 import decimal
@@ -10,6 +14,8 @@ import decimal
 class BasicMathCommands(BaseCommand):
     """Basic math operations: eval, simplify, expand, factor, etc."""
 
+    DEFAULT_SIMPLIFY_BUDGET = 2.0  # Seconds
+
     def get_commands(self):
         return {
             'eval': self.cmd_eval,
@@ -18,16 +24,35 @@ class BasicMathCommands(BaseCommand):
             'factor': self.cmd_factor,
             'rationalize': self.cmd_rationalize,
             'precision': self.cmd_precision,
+            'verbose': self.cmd_verbose,
         }
 
     def get_help(self):
         return {
             'eval': "EVAL: Evaluate mathematical expressions. Usage: eval <expression>",
-            'simplify': "SIMPLIFY: Simplify an expression. Usage: simplify <expr>",
+            'simplify': """
+SIMPLIFY: Simplify an expression within a time budget.
+
+Usage: simplify <expr> [, budget=<seconds>] [, measure=ops|length|nodes] [, full]
+
+Cheap strategies (cancel, together) run first, then rational (factor,
+apart), trig, power, log and gamma/factorial strategies. A strategy is
+kept only if it lowers the complexity measure; passes stop when one gives
+no improvement or the budget (default 2 s) is used up. 'full' also tries
+SymPy's general simplify as a last resort, outside the budget.
+""",
             'expand': "EXPAND: Expand an expression. Usage: expand <expr>",
             'factor': "FACTOR: Factor an expression. Usage: factor <expr>",
+            'verbose': "VERBOSE: Show timing details for commands. Usage: verbose [on|off]",
             'rationalize': "RATIONALIZE: Convert float to rational. Usage: rationalize <num> [tolerance]",
-            'precision': "PRECISION: Set display precision. Usage: precision <digits>"
+            'precision': """
+PRECISION: Set display precision and numeric evaluation mode.
+
+Usage:
+  precision <digits>           - Set number of decimal digits shown
+  precision adaptive [on|off]  - Raise working precision only until digits are stable
+  precision bound [on|off]     - Show an error bound with adaptive decimal results
+"""
         }
 
     def cmd_eval(self, args: str):
@@ -38,25 +63,72 @@ class BasicMathCommands(BaseCommand):
 
         expr_str = args.strip()
         try:
-            result = self.parser.parse(expr_str)
+            result = self.parser.parse_quantity(expr_str)
             self.formatter.display_result(result, "Result")
         except Exception as e:
             raise CommandError(f"Could not evaluate expression: {e}")
 
     def cmd_simplify(self, args: str):
-        from sympy import simplify
-        expr = self.parser.parse(args)
-        self.formatter.display_result(simplify(expr), "Simplified")
+        validator = InputValidator()
+        parts, options = validator.split_options(
+            validator.split_arguments(args), flags=('full',), keys=('budget', 'measure')
+        )
+        if len(parts) != 1 or not parts[0]:
+            raise CommandError("Usage: simplify <expr> [, budget=<seconds>] [, measure=ops|length|nodes] [, full]")
+        try:
+            budget = float(options.get('budget', self.DEFAULT_SIMPLIFY_BUDGET))
+        except ValueError:
+            raise CommandError(f"Invalid budget: {options['budget']}")
+        measure = options.get('measure', 'ops').lower()
+        if measure not in MEASURES:
+            raise CommandError(f"Unknown measure '{measure}' (choose from {', '.join(MEASURES)})")
+
+        expr = self.parser.parse(parts[0])
+        result = budgeted_simplify(expr, budget, measure, full=options.get('full', False))
+
+        self.formatter.display_result(result.expr, "Simplified")
+        strategy = ' -> '.join(result.steps) if result.steps else 'none'
+        note = ', budget exhausted' if result.exhausted else ''
+        print(f"Strategy: {strategy} ({measure} {result.before} -> {result.after}, "
+              f"{result.elapsed:.3f}s{note})")
 
     def cmd_expand(self, args: str):
         from sympy import expand
         expr = self.parser.parse(args)
-        self.formatter.display_result(expand(expr), "Expanded")
+        result = self._polynomial_fast_path(expr, 'expand', 'to expr', lambda poly: poly.as_expr())
+        if result is None:
+            start = time.perf_counter()
+            result = expand(expr)
+            self.formatter.display_timing('expand', [('generic', time.perf_counter() - start)])
+        self.formatter.display_result(result, "Expanded")
 
     def cmd_factor(self, args: str):
         from sympy import factor
         expr = self.parser.parse(args)
-        self.formatter.display_result(factor(expr), "Factored")
+        result = self._polynomial_fast_path(expr, 'factor', 'factor', factor_polynomial)
+        if result is None:
+            start = time.perf_counter()
+            result = factor(expr)
+            self.formatter.display_timing('factor', [('generic', time.perf_counter() - start)])
+        self.formatter.display_result(result, "Factored")
+
+    def _polynomial_fast_path(self, expr, name: str, stage: str, operation):
+        """
+        Run operation on expr converted to a sparse polynomial over ZZ/QQ.
+        Returns None when expr is not such a polynomial.
+        """
+        start = time.perf_counter()
+        poly = to_polynomial(expr)
+        if poly is None:
+            return None
+        converted = time.perf_counter()
+        result = operation(poly)
+        done = time.perf_counter()
+        self.formatter.display_timing(
+            f"{name} in {describe_ring(poly)}",
+            [('to ring', converted - start), (stage, done - converted)]
+        )
+        return result
 
     def cmd_rationalize(self, args: str):
         if not args.strip():
@@ -75,8 +147,21 @@ class BasicMathCommands(BaseCommand):
 
     def cmd_precision(self, args: str):
         if not args.strip():
-            print(f"Current precision: {self.formatter.precision}")
+            mode = "adaptive" if self.formatter.adaptive else "fixed"
+            print(f"Current precision: {self.formatter.precision} ({mode})")
+            return
+
+        parts = args.lower().split()
+        if parts[0] in ('adaptive', 'bound'):
+            enabled = self._parse_switch(parts[1] if len(parts) > 1 else 'on')
+            if parts[0] == 'adaptive':
+                self.formatter.adaptive = enabled
+                print(f"Adaptive evaluation {'enabled' if enabled else 'disabled'}")
+            else:
+                self.formatter.show_error_bound = enabled
+                print(f"Error bound display {'enabled' if enabled else 'disabled'}")
             return
+
         try:
             p = int(args.strip())
             self.formatter.set_precision(p)
@@ -85,3 +170,18 @@ class BasicMathCommands(BaseCommand):
             print(f"Precision set to {p}")
         except Exception as e:
             raise CommandError(f"Invalid precision value: {e}")
+
+    def _parse_switch(self, value: str) -> bool:
+        """Parse an on/off style argument."""
+        if value in ('on', 'true', '1', 'yes'):
+            return True
+        if value in ('off', 'false', '0', 'no'):
+            return False
+        raise CommandError(f"Expected 'on' or 'off', got '{value}'")
+
+    def cmd_verbose(self, args: str):
+        if not args.strip():
+            print(f"Verbose mode is {'on' if self.formatter.verbose else 'off'}")
+            return
+        self.formatter.verbose = self._parse_switch(args.strip().lower())
+        print(f"Verbose mode {'enabled' if self.formatter.verbose else 'disabled'}")
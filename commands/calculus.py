@@ -1,19 +1,39 @@
+from collections import OrderedDict
 from .base_command import BaseCommand
 from sympy import diff, integrate, Symbol
+from core.series import TaylorSeries, NotTaylorError
+from utils.exceptions import CommandError
+from utils.validation import InputValidator
 
 class CalculusCommands(BaseCommand):
-    """Differentiation and integration commands."""
+    """Differentiation, integration and series commands."""
+
+    SERIES_CACHE_SIZE = 32  # Expansions kept for incremental extension
+
+    def __init__(self, environment, parser, formatter):
+        super().__init__(environment, parser, formatter)
+        self._series_cache = OrderedDict()
 
     def get_commands(self):
         return {
             'diff': self.cmd_diff,
             'integrate': self.cmd_integrate,
+            'series': self.cmd_series,
         }
 
     def get_help(self):
         return {
             'diff': "DIFF: Differentiate an expression. Usage: diff <expr> [, var]",
             'integrate': "INTEGRATE: Integrate an expression. Usage: integrate <expr> [, var]",
+            'series': """
+SERIES: Truncated Taylor series.
+
+Usage: series <expr> [, var [, x0 [, n]]]     (defaults: x0 = 0, n = 6)
+
+Coefficients are cached per expression and point, so asking for a higher
+order afterwards only computes the new terms. Laurent and Puiseux
+expansions fall back to SymPy's general series.
+""",
         }
 
     def cmd_diff(self, args: str):
@@ -42,3 +62,48 @@ class CalculusCommands(BaseCommand):
         else:
             res = integrate(expr)
         self.formatter.display_result(res, "Integral")
+
+    def cmd_series(self, args: str):
+        parts = InputValidator().split_arguments(args)
+        if not parts or not parts[0]:
+            print("Usage: series <expr> [, var [, x0 [, n]]]")
+            return
+        expr = self.parser.parse(parts[0])
+
+        if len(parts) > 1:
+            var = Symbol(parts[1])
+        elif len(expr.free_symbols) == 1:
+            var = next(iter(expr.free_symbols))
+        else:
+            raise CommandError("Specify the expansion variable: series <expr>, var, x0, n")
+        x0 = self.parser.parse(parts[2]) if len(parts) > 2 else 0
+        try:
+            n = int(parts[3]) if len(parts) > 3 else 6
+        except ValueError:
+            raise CommandError(f"Order must be an integer, got '{parts[3]}'")
+        if n < 1:
+            raise CommandError("Order must be at least 1")
+
+        key = (expr, var, x0)
+        expansion = self._series_cache.get(key)
+        cached = expansion.order if expansion is not None else 0
+        if expansion is None:
+            try:
+                expansion = TaylorSeries(expr, var, x0)
+            except NotTaylorError:
+                self.formatter.display_result(expr.series(var, x0, n), "Series")
+                return
+            self._series_cache[key] = expansion
+            if len(self._series_cache) > self.SERIES_CACHE_SIZE:
+                self._series_cache.popitem(last=False)
+        else:
+            self._series_cache.move_to_end(key)
+
+        try:
+            result = expansion.as_expr(n)
+        except NotTaylorError:
+            del self._series_cache[key]
+            result = expr.series(var, x0, n)
+        if 0 < cached < n:
+            print(f"(extended cached series from order {cached} to {n})")
+        self.formatter.display_result(result, "Series")
@@ -0,0 +1,299 @@
+"""
+Code generation: standalone vectorized NumPy or C kernels from expressions.
+"""
+import os
+import random
+from .base_command import BaseCommand
+from utils.exceptions import CommandError
+from utils.validation import InputValidator
+from sympy import Symbol, cse, count_ops, numbered_symbols, Tuple as SymTuple
+from sympy.core.function import AppliedUndef
+
+
+class CodegenCommands(BaseCommand):
+    """Emit NumPy / C kernels with common subexpressions eliminated."""
+
+    LANGUAGES = ('numpy', 'c')
+    CHECK_POINTS = 8             # Random points embedded for the self-check
+    CHECK_RANGE = (0.25, 2.0)    # Sampling interval for self-check inputs
+    CHECK_RTOL = 1e-9
+
+    def get_commands(self):
+        return {
+            'codegen': self.cmd_codegen,
+        }
+
+    def get_help(self):
+        return {
+            'codegen': """
+CODEGEN: Generate a vectorized kernel from an expression.
+
+Usage:
+  codegen <expr | [expr1, expr2, ...]> [, lang=numpy|c] [, args=[x, y]]
+          [, name=<function>] [, out=<file>]
+
+Common subexpressions are eliminated before emitting code.
+  lang=numpy  writes <name>.py with a NumPy function
+  lang=c      writes <name>.c (scalar + array function) and <name>.py,
+              a ctypes loader that compiles the C file with the system
+              compiler on first use
+Both Python files contain _self_check(), which compares the kernel
+against SymPy reference values at random points; it is run once here.
+""",
+        }
+
+    def cmd_codegen(self, args: str):
+        validator = InputValidator()
+        parts, options = validator.split_options(
+            validator.split_arguments(args), keys=('lang', 'args', 'name', 'out')
+        )
+        if len(parts) != 1:
+            raise CommandError("Usage: codegen <expr> [, lang=numpy|c] [, args=[x, y]] [, name=f] [, out=file]")
+
+        lang = options.get('lang', 'numpy').lower()
+        if lang not in self.LANGUAGES:
+            raise CommandError(f"Unknown language '{lang}' (choose from {', '.join(self.LANGUAGES)})")
+
+        arg_names = self._parse_names(options['args']) if 'args' in options else None
+        expr_text = parts[0]
+        parsed = self.parser.parse(expr_text, symbols=arg_names)
+        outputs = list(parsed) if isinstance(parsed, (list, tuple, SymTuple)) else [parsed]
+
+        if arg_names is None:
+            free = set().union(*(getattr(e, 'free_symbols', set()) for e in outputs))
+            arg_names = sorted(str(s) for s in free)
+        arguments = [Symbol(n) for n in arg_names]
+        self._check_expressions(outputs, arguments)
+
+        default_name = expr_text if validator.VARIABLE_PATTERN.match(expr_text) else 'kernel'
+        name = validator.validate_variable_name(options.get('name', default_name))
+
+        # Common subexpression elimination, shared across all outputs
+        replacements, reduced = cse(outputs, symbols=numbered_symbols('cse'))
+        before = sum(count_ops(e) for e in outputs)
+        after = sum(count_ops(v) for _, v in replacements) + sum(count_ops(e) for e in reduced)
+
+        check = self._reference_values(outputs, arguments)
+        base, extension = os.path.splitext(options.get('out', name))
+        if extension not in ('.py', '.c'):
+            base += extension
+
+        if lang == 'numpy':
+            files = {base + '.py': self._numpy_source(name, arguments, outputs, replacements, reduced, check)}
+        else:
+            library = os.path.basename(base)
+            files = {
+                base + '.c': self._c_source(name, arguments, outputs, replacements, reduced),
+                base + '.py': self._ctypes_source(name, library, arguments, outputs, check),
+            }
+
+        for path, source in files.items():
+            try:
+                with open(path, 'w') as f:
+                    f.write(source)
+            except OSError as e:
+                raise CommandError(f"Could not write '{path}': {e}")
+
+        print(f"Generated {name}({', '.join(arg_names)}) -> {', '.join(files)}")
+        print(f"CSE: {len(replacements)} subexpressions, {before} ops -> {after} ops")
+        self._run_self_check(base + '.py')
+
+    # ------------------------------------------------------------------
+    # Validation and reference values
+    # ------------------------------------------------------------------
+    def _parse_names(self, text: str):
+        text = text.strip()
+        if text.startswith('[') and text.endswith(']'):
+            text = text[1:-1]
+        validator = InputValidator()
+        return [validator.validate_variable_name(n) for n in validator.split_arguments(text)]
+
+    def _check_expressions(self, outputs, arguments):
+        for expr in outputs:
+            if not hasattr(expr, 'free_symbols') or getattr(expr, 'is_Relational', False):
+                raise CommandError(f"Cannot generate code for: {expr}")
+            missing = expr.free_symbols - set(arguments)
+            if missing:
+                raise CommandError(f"Symbols {', '.join(sorted(map(str, missing)))} are not in args")
+            if expr.atoms(AppliedUndef):
+                raise CommandError("Undefined functions cannot be compiled")
+
+    def _reference_values(self, outputs, arguments):
+        """SymPy-evaluated outputs at random points, for the generated self-check."""
+        rng = random.Random(0)
+        inputs = [[] for _ in arguments]
+        expected = [[] for _ in outputs]
+        attempts = 0
+        while len(expected[0]) < self.CHECK_POINTS and attempts < 10 * self.CHECK_POINTS:
+            attempts += 1
+            point = {a: rng.uniform(*self.CHECK_RANGE) for a in arguments}
+            try:
+                values = [complex(e.evalf(30, subs=point)) for e in outputs]
+            except (TypeError, ValueError):
+                continue
+            if any(v.imag != 0 or v.real != v.real or abs(v.real) == float('inf') for v in values):
+                continue
+            for k, a in enumerate(arguments):
+                inputs[k].append(point[a])
+            for k, v in enumerate(values):
+                expected[k].append(v.real)
+        return inputs, expected
+
+    def _run_self_check(self, path: str):
+        import importlib.util
+        try:
+            spec = importlib.util.spec_from_file_location(f"symcalc_codegen_{abs(hash(path))}", path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            error = module._self_check()
+            if error is None:
+                print("Self-check skipped (no valid sample points)")
+            else:
+                print(f"Self-check passed (max relative error {error:.2e})")
+        except Exception as e:
+            print(f"Self-check failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Emitters
+    # ------------------------------------------------------------------
+    def _signature_doc(self, name, arguments, outputs) -> str:
+        args = ', '.join(map(str, arguments))
+        return '\n'.join(f"    {name}({args})[{k}] = {e}" if len(outputs) > 1 else f"    {name}({args}) = {e}"
+                         for k, e in enumerate(outputs))
+
+    def _check_block(self, check, multiple: bool) -> str:
+        inputs, expected = check
+        return f'''
+
+_CHECK_INPUTS = {inputs!r}
+_CHECK_EXPECTED = {expected!r}
+
+
+def _self_check(rtol={self.CHECK_RTOL!r}):
+    """
+    Compare against SymPy reference values; returns the max relative error,
+    or None if no valid real sample points were found (nothing was checked).
+    """
+    if not _CHECK_EXPECTED[0]:
+        return None
+    arrays = [numpy.array(v, dtype=float) for v in _CHECK_INPUTS]
+    results = {'_call(*arrays)' if multiple else '[_call(*arrays)]'}
+    worst = 0.0
+    for got, want in zip(results, _CHECK_EXPECTED):
+        want = numpy.array(want)
+        got = numpy.broadcast_to(numpy.asarray(got, dtype=float), want.shape)
+        error = numpy.max(numpy.abs(got - want) / numpy.maximum(numpy.abs(want), 1.0))
+        worst = max(worst, float(error))
+    if worst > rtol:
+        raise AssertionError(f"max relative error {{worst:.3e}} exceeds {{rtol:.1e}}")
+    return worst
+
+
+if __name__ == '__main__':
+    _error = _self_check()
+    if _error is None:
+        print("Self-check skipped (no valid sample points)")
+    else:
+        print(f"Self-check passed (max relative error {{_error:.2e}})")
+'''
+
+    def _numpy_source(self, name, arguments, outputs, replacements, reduced, check) -> str:
+        from sympy.printing.numpy import NumPyPrinter
+
+        printer = NumPyPrinter()
+        body = [f"    {sym} = {printer.doprint(value)}" for sym, value in replacements]
+        results = [printer.doprint(e) for e in reduced]
+        body.append(f"    return {results[0]}" if len(results) == 1 else f"    return ({', '.join(results)})")
+        imports = sorted(set(printer.module_imports) | {'numpy'})
+
+        args = ', '.join(map(str, arguments))
+        return (
+            f'"""\nGenerated by SymCalc codegen.\n\n{self._signature_doc(name, arguments, outputs)}\n"""\n'
+            + ''.join(f"import {m}\n" for m in imports)
+            + f"\n\ndef {name}({args}):\n"
+            + '    """Vectorized evaluation; arguments broadcast like NumPy arrays."""\n'
+            + '\n'.join(body) + '\n'
+            + f"\n\n_call = {name}"
+            + self._check_block(check, len(outputs) > 1)
+        )
+
+    def _c_source(self, name, arguments, outputs, replacements, reduced) -> str:
+        from sympy.printing.c import C99CodePrinter
+
+        printer = C99CodePrinter()
+        params = ', '.join(f"double {a}" for a in arguments)
+        pointers = ', '.join(f"const double *{a}" for a in arguments)
+        calls = ', '.join(f"{a}[i]" for a in arguments)
+        temps = ''.join(f"    const double {sym} = {printer.doprint(value)};\n" for sym, value in replacements)
+        k = len(outputs)
+
+        if k == 1:
+            scalar = (f"double {name}({params or 'void'})\n{{\n{temps}"
+                      f"    return {printer.doprint(reduced[0])};\n}}\n")
+            loop = f"        out[i] = {name}({calls});\n"
+        else:
+            stores = ''.join(f"    out[{j}] = {printer.doprint(e)};\n" for j, e in enumerate(reduced))
+            scalar = (f"void {name}({params + ', ' if params else ''}double *out)\n{{\n{temps}{stores}}}\n")
+            loop = f"        {name}({calls + ', ' if calls else ''}out + {k} * i);\n"
+
+        header = '\n'.join(' *' + line[1:] for line in self._signature_doc(name, arguments, outputs).split('\n'))
+        return (
+            f"/*\n * Generated by SymCalc codegen.\n *\n{header}\n */\n"
+            "#include <math.h>\n\n"
+            "#ifndef M_PI\n#define M_PI 3.14159265358979323846\n#endif\n"
+            "#ifndef M_E\n#define M_E 2.7182818284590452354\n#endif\n\n"
+            + scalar + "\n"
+            + (f"/* Array variant for ctypes: out has n values. */\n" if k == 1 else
+               f"/* Array variant for ctypes: out has n*{k} values, row-major. */\n")
+            + f"void {name}_array({pointers + ', ' if pointers else ''}double *out, long n)\n{{\n"
+            + "    for (long i = 0; i < n; ++i) {\n" + loop + "    }\n}\n"
+        )
+
+    def _ctypes_source(self, name, library, arguments, outputs, check) -> str:
+        args = ', '.join(map(str, arguments))
+        k = len(outputs)
+        return f'''"""
+ctypes loader for {library}.c, generated by SymCalc codegen.
+
+{self._signature_doc(name, arguments, outputs)}
+
+The C file is compiled with the system compiler ($CC, default cc) on
+first use; no build system is needed.
+"""
+import ctypes
+import os
+import subprocess
+import numpy
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_SOURCE = os.path.join(_HERE, {library + '.c'!r})
+# 'lib' prefix: a {library}.so next to {library}.py would shadow it on import
+_LIBRARY = os.path.join(_HERE, 'lib' + {library!r} + ('.dll' if os.name == 'nt' else '.so'))
+_POINTER = ctypes.POINTER(ctypes.c_double)
+
+
+def _load():
+    if not os.path.exists(_LIBRARY) or os.path.getmtime(_LIBRARY) < os.path.getmtime(_SOURCE):
+        compiler = os.environ.get('CC', 'cc')
+        subprocess.check_call([compiler, '-O2', '-shared', '-fPIC', '-o', _LIBRARY, _SOURCE, '-lm'])
+    kernel = ctypes.CDLL(_LIBRARY).{name}_array
+    kernel.restype = None
+    kernel.argtypes = [_POINTER] * {len(arguments) + 1} + [ctypes.c_long]
+    return kernel
+
+
+_kernel = _load()
+
+
+def {name}({args}):
+    """Evaluate over (broadcast) arrays with the compiled kernel."""
+    arrays = numpy.broadcast_arrays(*[numpy.asarray(a, dtype=numpy.float64) for a in ({args}{',' if len(arguments) == 1 else ''})])
+    shape = arrays[0].shape if arrays else ()
+    flat = [numpy.ascontiguousarray(a).ravel() for a in arrays]
+    n = flat[0].size if flat else 1
+    out = numpy.empty(n * {k})
+    _kernel(*[a.ctypes.data_as(_POINTER) for a in flat], out.ctypes.data_as(_POINTER), n)
+    {"return out.reshape(shape)" if k == 1 else f"return tuple(out.reshape(n, {k})[:, j].reshape(shape) for j in range({k}))"}
+
+
+_call = {name}''' + self._check_block(check, k > 1)
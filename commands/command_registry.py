@@ -5,6 +5,8 @@ import pkgutil
 import importlib
 import inspect
 from .base_command import BaseCommand
+from core.quantity import SIQuantity
+from utils.exceptions import CommandError
 
 
 class CommandRegistry:
@@ -36,6 +38,59 @@ class CommandRegistry:
             print(f"Unknown command: {command_name}")
             return None
 
+    def has_command(self, command_name):
+        """
+        Return True if a command with this name is registered.
+        """
+        return command_name.lower() in self._commands
+
+    def execute(self, command_name, args):
+        """
+        Alias of execute_command used by the REPL.
+        """
+        return self.execute_command(command_name, args)
+
+    def execute_pipeline(self, stages):
+        """
+        Run '|'-separated stages. Each stage's result object is bound to the
+        parser's pipe token for the next stage (prepended to its arguments
+        unless the stage uses it explicitly); only the last result is displayed.
+        A stage that is not a command is evaluated as an expression.
+        """
+        token = self.parser.PIPE_TOKEN
+        value = None
+        try:
+            for index, stage in enumerate(stages):
+                parts = stage.split(None, 1)
+                name = parts[0].lower()
+                args = parts[1] if len(parts) > 1 else ""
+                is_command = name in self._commands
+
+                if index > 0 and not self.parser.references_pipe(stage):
+                    if not is_command:
+                        raise CommandError(f"Pipeline stage '{stage}' is not a command and does not use '{token}'")
+                    args = f"{token}, {args}" if args.strip() else token
+
+                self.parser.pipe_value = value
+                if index == len(stages) - 1:
+                    self._run_stage(name, args, stage, is_command)
+                    return
+                with self.formatter.capture() as results:
+                    self._run_stage(name, args, stage, is_command)
+                if not results:
+                    raise CommandError(f"Pipeline stage '{stage}' produced no result")
+                value = results[-1]
+                if isinstance(value, SIQuantity):
+                    value = value.magnitude
+        finally:
+            self.parser.pipe_value = None
+
+    def _run_stage(self, name, args, stage, is_command):
+        if is_command:
+            self._commands[name](args)
+        else:
+            self.formatter.display_result(self.parser.parse_quantity(stage), "Result")
+
     def get_all_commands(self):
         """
         Return a dict of {command_name: help_text}.
@@ -0,0 +1,59 @@
+from .base_command import BaseCommand
+from utils.exceptions import CommandError
+
+class DisplayCommands(BaseCommand):
+    """Commands controlling how results are rendered."""
+
+    def get_commands(self):
+        return {
+            'show': self.cmd_show,
+        }
+
+    def get_help(self):
+        return {
+            'show': """
+SHOW: Re-display the last result or change the display size limit.
+
+Usage:
+  show last                   - Display the last result again
+  show last full              - Pretty-print the last result without size limit
+  show last full > <file>     - Write the last result to a file
+  show limit [<nodes>]        - Show or set the size above which results are summarised
+""",
+        }
+
+    def cmd_show(self, args: str):
+        target, _, output_path = args.partition('>')
+        words = target.lower().split()
+        output_path = output_path.strip()
+
+        if words[:1] == ['limit']:
+            self._set_limit(words[1:])
+            return
+        if words[:1] != ['last'] or len(words) > 2 or (len(words) == 2 and words[1] != 'full'):
+            raise CommandError("Usage: show last [full] [> <file>] | show limit [<nodes>]")
+        if self.formatter.last_result is None:
+            raise CommandError("No result to show yet")
+
+        if len(words) == 2:
+            try:
+                self.formatter.display_full(output_path or None)
+            except OSError as e:
+                raise CommandError(f"Could not write {output_path}: {e}")
+        elif output_path:
+            raise CommandError("Use 'show last full > <file>' to save a result")
+        else:
+            self.formatter.display_result(self.formatter.last_result, self.formatter.last_label, record=False)
+
+    def _set_limit(self, values):
+        if not values:
+            print(f"Results larger than {self.formatter.size_limit} nodes are summarised")
+            return
+        try:
+            limit = int(values[0])
+        except ValueError:
+            raise CommandError(f"Invalid limit: {values[0]}")
+        if limit < 1:
+            raise CommandError("Limit must be positive")
+        self.formatter.size_limit = limit
+        print(f"Results larger than {limit} nodes will be summarised")
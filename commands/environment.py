@@ -1,8 +1,12 @@
 """
-Environment management commands (let, view, clear).
+Environment management commands (let, load, save, view, clear).
 """
+import re
 from .base_command import BaseCommand
-from utils.exceptions import CommandError, EnvironmentError
+from core.arrays import ArrayVariable, ArrayExpression, is_array, save_array
+from core.quantity import SIQuantity
+from utils.datafiles import parse_file_reference
+from utils.exceptions import CommandError, EnvironmentError, DimensionError, DataError
 
 class EnvironmentCommands(BaseCommand):
     """Commands for variable management."""
@@ -10,6 +14,8 @@ class EnvironmentCommands(BaseCommand):
     def get_commands(self):
         return {
             'let': self.cmd_let,
+            'load': self.cmd_load,
+            'save': self.cmd_save,
             'view': self.cmd_view,
             'clear': self.cmd_clear,
         }
@@ -22,6 +28,21 @@ LET: Store variables and expressions.
 Usage:
   let <name>           - Create symbolic variable
   let <name> = <expr>  - Store expression or value
+""",
+            'load': """
+LOAD: Map a data file as an array variable without reading it into memory.
+
+Usage:
+  load <name> = data.npy          - Memory-map a NumPy array file
+  load <name> = data.csv[column]  - Map a CSV column (converted once to a cached .npy)
+
+Expressions over array variables (let y = 2*x + 1, mean x^2) are compiled
+and evaluated elementwise in chunks with NumPy broadcasting.
+""",
+            'save': """
+SAVE: Write an array variable or array expression to a file, chunk by chunk.
+
+Usage: save <name|expr> to <file.npy|file.csv>
 """,
             'view': "VIEW: Display all stored variables. Usage: view",
             'clear': "CLEAR: Remove stored variables. Usage: clear <name> | clear all"
@@ -46,16 +67,22 @@ Usage:
                     if self._try_store_unit_quantity(name, value_str):
                         return
 
-                    # Parse as expression
-                    value = self.parser.parse(value_str)
+                    # Parse as expression, carrying units of stored quantities
+                    value = self.parser.parse_quantity(value_str)
                     self.env.store(name, value)
 
                     # Display what was stored
-                    if hasattr(value, 'is_Number') and value.is_Number:
+                    if isinstance(value, SIQuantity):
+                        print(f"Stored unit quantity: {name} = {value}")
+                    elif isinstance(value, ArrayExpression):
+                        print(f"Stored array expression: {name} = {value.expr} ({len(value)} rows, lazy)")
+                    elif hasattr(value, 'is_Number') and value.is_Number:
                         self.formatter.display_result(value, f"Stored {name}")
                     else:
                         print(f"Stored symbolic expression: {name} = {value}")
 
+                except DimensionError as e:
+                    raise CommandError(str(e))
                 except Exception as e:
                     # Fallback to direct numeric parsing
                     try:
@@ -77,16 +104,59 @@ Usage:
 
     def _try_store_unit_quantity(self, name: str, value_str: str) -> bool:
         """Try to store as pint unit quantity."""
+        # Expressions over stored variables are evaluated by the parser instead;
+        # stored names shadow unit names ('m*a' with m and a stored)
+        import sympy
+        names = re.findall(r'[A-Za-z_]\w*', value_str)
+        if any(self.env.has(n) for n in names) and all(self.env.has(n) or hasattr(sympy, n) for n in names):
+            return False
         try:
-            from pint import UnitRegistry
-            ureg = UnitRegistry()
+            from utils.units import get_unit_registry
+            ureg = get_unit_registry()
             quantity = ureg(value_str)
+            if not hasattr(quantity, 'units') or str(quantity.units) == 'dimensionless':
+                return False  # Plain numbers are stored as exact SymPy values
             self.env.store(name, quantity)
             print(f"Stored unit quantity: {name} = {quantity}")
             return True
         except Exception:
             return False
 
+    def cmd_load(self, args: str):
+        """Handle load command."""
+        name, sep, reference = args.partition('=')
+        name, reference = name.strip(), reference.strip()
+        if not sep or not name or not reference:
+            raise CommandError("Usage: load <name> = data.npy | data.csv[column]")
+
+        try:
+            path, column = parse_file_reference(reference)
+            if path.lower().endswith('.csv') and column is None:
+                raise CommandError("Specify a column: load <name> = data.csv[column]")
+            if column is not None and not path.lower().endswith('.csv'):
+                raise CommandError("Columns can only be selected from CSV files")
+            array = ArrayVariable(path, column)
+            self.env.store(name, array)
+        except (DataError, EnvironmentError) as e:
+            raise CommandError(str(e))
+        print(f"Loaded array: {name} = {array.describe()} (memory-mapped)")
+
+    def cmd_save(self, args: str):
+        """Handle save command."""
+        match = re.match(r'^(?P<source>.+?)\s+to\s+(?P<path>\S+)\s*$', args.strip())
+        if not match:
+            raise CommandError("Usage: save <name|expr> to <file.npy|file.csv>")
+        source, path = match.group('source'), match.group('path')
+
+        value = self.parser.parse_quantity(source)
+        if not is_array(value):
+            raise CommandError(f"'{source}' is not an array expression")
+        try:
+            rows = save_array(value, path)
+        except OSError as e:
+            raise CommandError(f"Could not write {path}: {e}")
+        print(f"Saved {rows} rows to {path}")
+
     def cmd_view(self, args: str):
         """Handle view command."""
         variables = self.env.list_variables()
@@ -98,8 +168,12 @@ Usage:
         print("Stored variables:")
         for name, value in sorted(variables.items()):
             # Determine type and display format
-            if hasattr(value, 'units'):  # pint quantity
-                print(f"  {name:12} (unit)       = {value}")
+            if isinstance(value, SIQuantity):
+                print(f"  {name:12} (unit)       = {value.original or value}")
+            elif isinstance(value, ArrayVariable):
+                print(f"  {name:12} (array)      = {value.describe()}")
+            elif isinstance(value, ArrayExpression):
+                print(f"  {name:12} (array)      = {value.expr}, {len(value)} rows (lazy)")
             elif hasattr(value, 'is_Symbol') and value.is_Symbol:
                 print(f"  {name:12} (symbol)     = {value}")
             elif hasattr(value, 'is_Number') and value.is_Number:
@@ -0,0 +1,202 @@
+"""
+Nonlinear least-squares curve fitting of symbolic models to data files.
+"""
+import time
+from .base_command import BaseCommand
+from core.compiler import compile_numpy, broadcast_columns
+from utils.datafiles import parse_file_reference, read_csv_header, load_csv_columns
+from utils.exceptions import CommandError, SymCalcError
+from utils.validation import InputValidator
+from sympy import Symbol, Float, Matrix, diff
+
+
+class FittingCommands(BaseCommand):
+    """Curve fitting with a compiled model and analytic Jacobian."""
+
+    DEFAULT_MAX_ITERATIONS = 200
+    TOLERANCE = 1e-10       # Relative change in cost / parameters for convergence
+    DEFAULT_RESPONSE = 'y'  # Response column when the model is not an equation
+
+    def get_commands(self):
+        return {
+            'fit': self.cmd_fit,
+        }
+
+    def get_help(self):
+        return {
+            'fit': """
+FIT: Levenberg-Marquardt least-squares fit of a model to CSV data.
+
+Usage:
+  fit <model>, [p1, p2, ...], <data.csv> [, store] [, maxiter=N]
+
+  <model> is an expression in parameters and column names. Write it as
+  '<column> = <expr>' to name the response column (default column: y).
+  Parameters take optional starting values: [a=1, b=0.5].
+  'store' saves the fitted parameters as variables.
+
+Example:
+  fit y = a*exp(-b*t) + c, [a=1, b=0.1, c=0], decay.csv, store
+""",
+        }
+
+    def cmd_fit(self, args: str):
+        validator = InputValidator()
+        parts, options = validator.split_options(
+            validator.split_arguments(args), flags=('store',), keys=('maxiter',)
+        )
+        if len(parts) != 3:
+            raise CommandError("Usage: fit <model>, [p1, p2, ...], <data.csv> [, store]")
+        model_str, params_str, data_str = parts
+
+        names, initial = self._parse_parameters(params_str)
+        path, _ = parse_file_reference(data_str)
+        header = read_csv_header(path)
+
+        # Parameters and data columns stay symbolic even if stored as variables
+        parsed = self.parser.parse(model_str, symbols=names + header)
+        if hasattr(parsed, 'lhs') and hasattr(parsed, 'rhs'):
+            if not parsed.lhs.is_Symbol:
+                raise CommandError("Left side of the model must be a column name")
+            response, model = str(parsed.lhs), parsed.rhs
+        else:
+            response, model = self.DEFAULT_RESPONSE, parsed
+
+        params = [Symbol(n) for n in names]
+        variables = sorted((s for s in model.free_symbols if s not in params), key=str)
+        unknown = [str(v) for v in variables if str(v) not in header]
+        if unknown:
+            raise CommandError(f"Model symbols {', '.join(unknown)} are neither parameters nor columns of '{path}'")
+
+        start = time.perf_counter()
+        columns = load_csv_columns(path, [str(v) for v in variables] + [response])
+        x = [columns[str(v)] for v in variables]
+        y = columns[response]
+        load_time = time.perf_counter() - start
+
+        # Compile model and analytic Jacobian once, sharing subexpressions
+        jacobian = [diff(model, p) for p in params]
+        model_fn = compile_numpy(params + variables, model)
+        model_jac_fn = compile_numpy(params + variables, [model] + jacobian)
+
+        m, n = len(y), len(params)
+        if m <= n:
+            raise CommandError(f"Need more data rows ({m}) than parameters ({n})")
+
+        def residuals(p):
+            return broadcast_columns([model_fn(*p, *x)], m)[:, 0] - y
+
+        def residuals_and_jacobian(p):
+            values = broadcast_columns(model_jac_fn(*p, *x), m)
+            return values[:, 0] - y, values[:, 1:]
+
+        maxiter = int(options.get('maxiter', self.DEFAULT_MAX_ITERATIONS))
+        start = time.perf_counter()
+        p, r, J, iterations, converged = self._levenberg_marquardt(
+            residuals, residuals_and_jacobian, initial, maxiter
+        )
+        fit_time = time.perf_counter() - start
+
+        self._report(names, p, r, J, y, iterations, converged, load_time, fit_time)
+
+        if options.get('store'):
+            for name, value in zip(names, p):
+                self.env.store(name, Float(float(value)))
+            print(f"Stored fitted parameters: {', '.join(names)}")
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+    def _parse_parameters(self, text: str):
+        """Parse '[a, b=2, c]' into names and starting values."""
+        text = text.strip()
+        if text.startswith('[') and text.endswith(']'):
+            text = text[1:-1]
+        validator = InputValidator()
+        names, initial = [], []
+        for item in validator.split_arguments(text):
+            name, sep, value = item.partition('=')
+            name = validator.validate_variable_name(name.strip())
+            try:
+                initial.append(float(self.parser.parse(value.strip())) if sep else 1.0)
+            except (TypeError, SymCalcError) as e:
+                raise CommandError(f"Invalid starting value for {name}: {e}")
+            names.append(name)
+        if not names:
+            raise CommandError("No parameters given")
+        return names, initial
+
+    def _levenberg_marquardt(self, residuals, residuals_and_jacobian, initial, maxiter):
+        """
+        Minimize sum(residuals**2) with Marquardt-scaled damping. Works on
+        the n-by-n normal equations, so cost per step is linear in the rows.
+        """
+        import numpy as np
+
+        p = np.asarray(initial, dtype=float)
+        r, J = residuals_and_jacobian(p)
+        cost = r @ r
+        damping = 1e-3
+        converged = False
+
+        for iteration in range(1, maxiter + 1):
+            g = J.T @ r
+            A = J.T @ J
+            scale = np.maximum(np.diag(A), 1e-12)
+
+            while True:
+                try:
+                    step = np.linalg.solve(A + damping * np.diag(scale), -g)
+                except np.linalg.LinAlgError:
+                    step = np.linalg.lstsq(A + damping * np.diag(scale), -g, rcond=None)[0]
+                trial = p + step
+                trial_r = residuals(trial)
+                trial_cost = trial_r @ trial_r
+                if np.isfinite(trial_cost) and trial_cost < cost:
+                    break
+                damping *= 10
+                if damping > 1e16:
+                    return p, r, J, iteration, True  # No downhill step left
+
+            improvement = cost - trial_cost
+            p = trial
+            r, J = residuals_and_jacobian(p)
+            cost = r @ r
+            damping = max(damping / 10, 1e-12)
+
+            small_step = np.linalg.norm(step) <= self.TOLERANCE * (np.linalg.norm(p) + self.TOLERANCE)
+            if small_step or improvement <= self.TOLERANCE * cost:
+                converged = True
+                break
+
+        return p, r, J, iteration, converged
+
+    def _report(self, names, p, r, J, y, iterations, converged, load_time, fit_time):
+        """Print fitted parameters, covariance and residual statistics."""
+        import numpy as np
+
+        m, n = J.shape
+        ssr = float(r @ r)
+        dof = m - n
+        variance = ssr / dof
+        try:
+            covariance = variance * np.linalg.inv(J.T @ J)
+        except np.linalg.LinAlgError:
+            covariance = np.full((n, n), np.nan)
+        stderr = np.sqrt(np.abs(np.diag(covariance)))
+        sst = float(np.sum((y - y.mean()) ** 2))
+
+        status = "converged" if converged else "stopped at iteration limit"
+        print(f"Fit {status} after {iterations} iterations ({m} rows, "
+              f"load {load_time:.3f}s, fit {fit_time:.3f}s)")
+        print("Parameters:")
+        for name, value, err in zip(names, p, stderr):
+            print(f"  {name:12} = {value: .10g}  ± {err:.4g}")
+
+        print("Residuals:")
+        print(f"  SSR          = {ssr:.6g}")
+        print(f"  RMSE         = {np.sqrt(ssr / m):.6g}")
+        print(f"  R^2          = {1 - ssr / sst if sst > 0 else float('nan'):.6g}")
+        print(f"  dof          = {dof}")
+
+        self.formatter.display_result(Matrix(covariance.tolist()), "Covariance")
@@ -0,0 +1,65 @@
+from .base_command import BaseCommand
+from utils.exceptions import CommandError
+
+class HistoryCommands(BaseCommand):
+    """Result history: list, clear and size limits."""
+
+    PREVIEW_CHARS = 70
+
+    def get_commands(self):
+        return {
+            'history': self.cmd_history,
+        }
+
+    def get_help(self):
+        return {
+            'history': """
+HISTORY: List previous results, usable as ans (the last one) and out[n].
+
+Usage:
+  history                          - List stored results
+  history clear                    - Forget all stored results
+  history limit <entries> [<nodes>] - Results and total expression size kept in memory
+
+Results beyond the memory limits are written to a temporary directory and
+loaded again when referenced.
+""",
+        }
+
+    def cmd_history(self, args: str):
+        history = self.env.history
+        words = args.split()
+        if not words:
+            self._list(history)
+        elif words[0].lower() == 'clear':
+            history.clear()
+            print("History cleared")
+        elif words[0].lower() == 'limit':
+            if len(words) == 1:
+                print(f"Keeping {history.max_entries} results / {history.max_nodes} nodes in memory")
+                return
+            try:
+                limits = [int(w) for w in words[1:3]]
+            except ValueError:
+                raise CommandError("Usage: history limit <entries> [<nodes>]")
+            if any(n < 1 for n in limits):
+                raise CommandError("Limits must be positive")
+            history.set_limits(*limits)
+            print(f"Keeping {history.max_entries} results / {history.max_nodes} nodes in memory")
+        else:
+            raise CommandError("Usage: history [clear | limit <entries> [<nodes>]]")
+
+    def _list(self, history):
+        entries = history.entries()
+        if not entries:
+            print("No results in history")
+            return
+        for number, location, value, size in entries:
+            if location == 'disk':
+                preview = "(on disk)"
+            else:
+                preview = self.formatter.summarize(value)
+                if len(preview) > self.PREVIEW_CHARS:
+                    preview = preview[:self.PREVIEW_CHARS - 3] + '...'
+            print(f"  out[{number}]: {preview}")
+        print(f"{len(entries)} results, {history.memory_nodes} nodes in memory")
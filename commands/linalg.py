@@ -0,0 +1,393 @@
+"""
+Linear algebra commands with backends chosen from the matrix entries.
+
+Float matrices go to NumPy (or SciPy sparse when large and mostly zero),
+exact rational/polynomial matrices to SymPy's DomainMatrix, and anything
+else to the generic SymPy Matrix methods.
+"""
+from .base_command import BaseCommand
+from utils.exceptions import CommandError
+from utils.validation import InputValidator
+from sympy import Matrix, eye, sympify, linsolve
+
+
+class LinearAlgebraCommands(BaseCommand):
+    """Matrix commands: det, inv, rank, eig, lu, linsolve, nullspace."""
+
+    SPARSE_MIN_SIZE = 200       # Smallest dimension worth a sparse factorization
+    SPARSE_MAX_DENSITY = 0.05   # Fraction of nonzeros below which sparse is used
+    RANK_TOLERANCE = 1e-10      # Relative singular value cutoff for numeric rank
+
+    def get_commands(self):
+        return {
+            'det': self.cmd_det,
+            'inv': self.cmd_inv,
+            'rank': self.cmd_rank,
+            'eig': self.cmd_eig,
+            'lu': self.cmd_lu,
+            'linsolve': self.cmd_linsolve,
+            'nullspace': self.cmd_nullspace,
+        }
+
+    def get_help(self):
+        return {
+            'det': "DET: Matrix determinant. Usage: det <matrix>",
+            'inv': "INV: Matrix inverse. Usage: inv <matrix>",
+            'rank': "RANK: Matrix rank. Usage: rank <matrix>",
+            'eig': "EIG: Eigenvalues and eigenvectors. Usage: eig <matrix>",
+            'lu': "LU: LU decomposition with row pivoting (P*A = L*U). Usage: lu <matrix>",
+            'linsolve': "LINSOLVE: Solve A*x = b. Usage: linsolve <matrix A>, <vector b>",
+            'nullspace': "NULLSPACE: Basis of the null space. Usage: nullspace <matrix>",
+        }
+
+    # ------------------------------------------------------------------
+    # Commands
+    # ------------------------------------------------------------------
+    def cmd_det(self, args: str):
+        matrix = self._parse_matrix(args, "det <matrix>")
+        self._require_square(matrix)
+        backend, data = self._prepare(matrix)
+
+        if backend == 'numpy':
+            import numpy as np
+            result = self._to_sympy(np.linalg.det(data))
+        elif backend == 'sparse':
+            result = self._to_sympy(self._sparse_det(data))
+        elif backend == 'domain':
+            result = data.domain.to_sympy(data.det())
+        else:
+            result = data.det()
+
+        self.formatter.display_result(result, f"Determinant [{backend}]")
+
+    def cmd_inv(self, args: str):
+        matrix = self._parse_matrix(args, "inv <matrix>")
+        self._require_square(matrix)
+        backend, data = self._prepare(matrix)
+
+        try:
+            if backend == 'numpy':
+                import numpy as np
+                result = self._to_sympy(np.linalg.inv(data))
+            elif backend == 'sparse':
+                from scipy.sparse.linalg import inv
+                result = self._to_sympy(inv(data).toarray())
+            elif backend == 'domain':
+                result = data.to_field().inv().to_Matrix()
+            else:
+                result = data.inv()
+        except Exception as e:
+            raise CommandError(f"Matrix is not invertible: {e}")
+
+        self.formatter.display_result(result, f"Inverse [{backend}]")
+
+    def cmd_rank(self, args: str):
+        matrix = self._parse_matrix(args, "rank <matrix>")
+        backend, data = self._prepare(matrix)
+
+        if backend in ('numpy', 'sparse'):
+            result = self._numeric_rank(self._dense(data))
+        else:
+            result = data.rank()
+
+        self.formatter.display_result(int(result), f"Rank [{backend}]")
+
+    def cmd_eig(self, args: str):
+        matrix = self._parse_matrix(args, "eig <matrix>")
+        self._require_square(matrix)
+        backend, data = self._prepare(matrix)
+
+        if backend in ('numpy', 'sparse'):
+            import numpy as np
+            dense = self._dense(data)
+            if np.isrealobj(dense) and np.allclose(dense, dense.T):
+                values, vectors = np.linalg.eigh(dense)
+            else:
+                values, vectors = np.linalg.eig(dense)
+            self.formatter.display_result(self._to_sympy(values), f"Eigenvalues [{backend}]")
+            self.formatter.display_result(self._to_sympy(vectors), "Eigenvectors (columns)")
+            return
+
+        if backend == 'domain':
+            eigenvalues = self._domain_eigenvalues(data, matrix)
+        else:
+            eigenvalues = data.eigenvals()
+
+        result = []
+        for value, multiplicity in eigenvalues.items():
+            vectors = (matrix - value * eye(matrix.rows)).nullspace()
+            result.append((value, multiplicity, vectors))
+        self.formatter.display_result(result, f"Eigenvalues, multiplicities, eigenvectors [{backend}]")
+
+    def cmd_lu(self, args: str):
+        matrix = self._parse_matrix(args, "lu <matrix>")
+        backend, data = self._prepare(matrix)
+
+        if backend == 'numpy':
+            P, L, U = self._dense_lu(data)
+            P, L, U = self._to_sympy(P), self._to_sympy(L), self._to_sympy(U)
+        elif backend == 'sparse':
+            import numpy as np
+            from scipy.sparse.linalg import splu
+            lu = splu(data)
+            # SuperLU factors Pr*A*Pc = L*U; report both permutations
+            n = data.shape[0]
+            Pr = np.zeros((n, n))
+            Pr[lu.perm_r, np.arange(n)] = 1
+            Pc = np.zeros((n, n))
+            Pc[np.arange(n), lu.perm_c] = 1
+            self.formatter.display_result(self._to_sympy(Pc), "Column permutation Pc [sparse]")
+            P, L, U = self._to_sympy(Pr), self._to_sympy(lu.L.toarray()), self._to_sympy(lu.U.toarray())
+        elif backend == 'domain':
+            L, U, swaps = data.to_field().lu()
+            P = eye(matrix.rows)
+            for i, j in swaps:
+                P.row_swap(i, j)
+            L, U = L.to_Matrix(), U.to_Matrix()
+        else:
+            L, U, perm = data.LUdecomposition()
+            P = eye(matrix.rows)
+            for i, j in perm:
+                P.row_swap(i, j)
+
+        self.formatter.display_result(P, f"P [{backend}]")
+        self.formatter.display_result(L, "L")
+        self.formatter.display_result(U, "U")
+
+    def cmd_linsolve(self, args: str):
+        parts = InputValidator().split_arguments(args)
+        if len(parts) != 2:
+            raise CommandError("Usage: linsolve <matrix A>, <vector b>")
+        A = self._parse_matrix(parts[0], "linsolve <matrix A>, <vector b>")
+        b = self._parse_matrix(parts[1], "linsolve <matrix A>, <vector b>")
+        if b.rows != A.rows:
+            raise CommandError(f"Shape mismatch: A has {A.rows} rows, b has {b.rows}")
+
+        backend = self._select_backend(A.row_join(b))
+        square = A.rows == A.cols
+
+        if backend in ('numpy', 'sparse'):
+            import numpy as np
+            _, a = self._prepare(A, backend)
+            rhs = self._dense(self._prepare(b, 'numpy')[1])
+            label = f"Solution [{backend}]"
+            try:
+                if not square:
+                    raise np.linalg.LinAlgError("non-square system")
+                if backend == 'sparse':
+                    from scipy.sparse.linalg import spsolve
+                    x = spsolve(a, rhs)
+                    if not np.all(np.isfinite(x)):
+                        raise np.linalg.LinAlgError("singular matrix")
+                else:
+                    x = np.linalg.solve(a, rhs)
+            except (np.linalg.LinAlgError, RuntimeError):
+                x = np.linalg.lstsq(self._dense(a), rhs, rcond=None)[0]
+                label = f"Least-squares solution [{backend}]"
+            result = self._to_sympy(np.asarray(x).reshape(A.cols, b.cols))
+        elif backend == 'domain' and square:
+            from sympy.polys.matrices import DomainMatrix
+            Ad, bd = DomainMatrix.from_Matrix(A), DomainMatrix.from_Matrix(b)
+            Ad, bd = Ad.unify(bd)
+            Ad, bd = Ad.to_field(), bd.to_field()
+            if Ad.rank() == A.rows:
+                result = Ad.lu_solve(bd).to_Matrix()
+            else:
+                result = linsolve((A, b))
+            label = f"Solution [{backend}]"
+        else:
+            result = linsolve((A, b))
+            label = f"Solution [{backend}]"
+
+        self.formatter.display_result(result, label)
+
+    def cmd_nullspace(self, args: str):
+        matrix = self._parse_matrix(args, "nullspace <matrix>")
+        backend, data = self._prepare(matrix)
+
+        if backend in ('numpy', 'sparse'):
+            import numpy as np
+            dense = self._dense(data)
+            _, s, vh = np.linalg.svd(dense)
+            rank = self._numeric_rank(dense, s)
+            basis = vh[rank:].conj().T
+            result = [self._to_sympy(basis[:, [k]]) for k in range(basis.shape[1])]
+        elif backend == 'domain':
+            rows = data.to_field().nullspace().to_Matrix()
+            result = [rows.row(k).T for k in range(rows.rows)]
+        else:
+            result = data.nullspace()
+
+        self.formatter.display_result(result, f"Null space basis [{backend}]")
+
+    # ------------------------------------------------------------------
+    # Backend selection and conversion
+    # ------------------------------------------------------------------
+    def _parse_matrix(self, text: str, usage: str) -> Matrix:
+        """Parse a matrix literal, list or stored matrix variable."""
+        if not text.strip():
+            raise CommandError(f"Usage: {usage}")
+        value = self.parser.parse(text.strip())
+        if isinstance(value, (list, tuple)):
+            value = Matrix(value)
+        if not getattr(value, 'is_Matrix', False):
+            raise CommandError(f"Expected a matrix, got: {value}")
+        return Matrix(value)
+
+    def _require_square(self, matrix: Matrix) -> None:
+        if matrix.rows != matrix.cols:
+            raise CommandError(f"Matrix must be square, got {matrix.rows}x{matrix.cols}")
+
+    def _select_backend(self, matrix: Matrix) -> str:
+        """Pick 'numpy', 'sparse', 'domain' or 'sympy' from entry types and sparsity."""
+        has_float = False
+        for e in matrix:
+            if e.is_Float:
+                has_float = True
+            elif not e.is_Rational and not e.is_number:
+                has_float = False
+                break
+        if has_float:
+            rows, cols = matrix.shape
+            if rows == cols and rows >= self.SPARSE_MIN_SIZE and self._has_scipy():
+                import numpy as np
+                nonzero = np.count_nonzero(self._to_numpy(matrix))
+                if nonzero <= self.SPARSE_MAX_DENSITY * rows * cols:
+                    return 'sparse'
+            return 'numpy'
+
+        from sympy.polys.matrices import DomainMatrix
+        try:
+            domain = DomainMatrix.from_Matrix(matrix).domain
+        except Exception:
+            return 'sympy'
+        if domain.is_EX or not domain.is_Exact:
+            return 'sympy'
+        return 'domain'
+
+    def _prepare(self, matrix: Matrix, backend: str = None):
+        """Convert matrix into the native representation of its backend."""
+        backend = backend or self._select_backend(matrix)
+
+        if backend == 'numpy':
+            return backend, self._to_numpy(matrix)
+        if backend == 'sparse':
+            from scipy.sparse import csc_matrix
+            return backend, csc_matrix(self._to_numpy(matrix))
+
+        if backend == 'domain':
+            from sympy.polys.matrices import DomainMatrix
+            return backend, DomainMatrix.from_Matrix(matrix)
+
+        return backend, matrix
+
+    def _to_numpy(self, matrix: Matrix):
+        """Dense float (or complex) array of a numeric matrix."""
+        import numpy as np
+        try:
+            return np.array(matrix.tolist(), dtype=float)
+        except TypeError:
+            return np.array([complex(e) for e in matrix], dtype=complex).reshape(matrix.shape)
+
+    def _has_scipy(self) -> bool:
+        try:
+            import scipy.sparse  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def _dense(self, data):
+        """Return a dense NumPy array for numpy/sparse backend data."""
+        return data.toarray() if hasattr(data, 'toarray') else data
+
+    def _to_sympy(self, value):
+        """Convert NumPy scalars and arrays to SymPy objects for display."""
+        import numpy as np
+        if isinstance(value, np.ndarray):
+            if value.ndim == 1:
+                value = value.reshape(-1, 1)
+            return Matrix(value.tolist())
+        return sympify(complex(value) if np.iscomplexobj(value) else float(value))
+
+    # ------------------------------------------------------------------
+    # Numeric helpers
+    # ------------------------------------------------------------------
+    def _numeric_rank(self, dense, singular_values=None) -> int:
+        import numpy as np
+        s = np.linalg.svd(dense, compute_uv=False) if singular_values is None else singular_values
+        if s.size == 0 or s[0] == 0:
+            return 0
+        return int(np.sum(s > self.RANK_TOLERANCE * s[0]))
+
+    def _sparse_det(self, data):
+        """Determinant from a sparse LU factorization."""
+        import numpy as np
+        from scipy.sparse.linalg import splu
+        try:
+            lu = splu(data)
+        except RuntimeError:
+            return 0.0  # exactly singular
+        sign = self._permutation_sign(lu.perm_r) * self._permutation_sign(lu.perm_c)
+        return sign * np.prod(lu.U.diagonal())
+
+    def _permutation_sign(self, perm) -> int:
+        """Sign of a permutation given as an index array."""
+        seen = [False] * len(perm)
+        transpositions = 0
+        for start in range(len(perm)):
+            length = 0
+            k = start
+            while not seen[k]:
+                seen[k] = True
+                k = perm[k]
+                length += 1
+            if length:
+                transpositions += length - 1
+        return -1 if transpositions % 2 else 1
+
+    def _dense_lu(self, a):
+        """Dense LU with partial pivoting, returning P, L, U with P*A = L*U."""
+        import numpy as np
+        try:
+            from scipy.linalg import lu
+            P, L, U = lu(a)  # SciPy returns A = P*L*U
+            return P.T, L, U
+        except ImportError:
+            pass
+
+        n, m = a.shape
+        U = np.array(a, dtype=np.result_type(a, float))
+        L = np.eye(n, dtype=U.dtype)
+        perm = np.arange(n)
+        for k in range(min(n, m)):
+            pivot = k + int(np.argmax(np.abs(U[k:, k])))
+            if pivot != k:
+                U[[k, pivot]] = U[[pivot, k]]
+                L[[k, pivot], :k] = L[[pivot, k], :k]
+                perm[[k, pivot]] = perm[[pivot, k]]
+            if U[k, k] == 0:
+                continue
+            factors = U[k + 1:, k] / U[k, k]
+            L[k + 1:, k] = factors
+            U[k + 1:] -= np.outer(factors, U[k])
+        P = np.eye(n)[perm]
+        return P, L, U
+
+    # ------------------------------------------------------------------
+    # Exact helpers
+    # ------------------------------------------------------------------
+    def _domain_eigenvalues(self, data, matrix: Matrix):
+        """Eigenvalues from the fraction-free characteristic polynomial."""
+        from sympy import Poly, Dummy, roots
+        lam = Dummy('lambda')
+        coeffs = [data.domain.to_sympy(c) for c in data.charpoly()]
+        poly = Poly(coeffs, lam)
+        found = roots(poly)
+        if sum(found.values()) != poly.degree():
+            try:
+                found = {}
+                for root in poly.all_roots():
+                    found[root] = found.get(root, 0) + 1
+            except Exception:
+                return matrix.eigenvals()
+        return found
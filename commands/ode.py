@@ -0,0 +1,282 @@
+"""
+Ordinary differential equations: symbolic dsolve and a compiled numeric integrator.
+"""
+import re
+from .base_command import BaseCommand
+from core.compiler import compile_numpy
+from utils.exceptions import CommandError
+from utils.validation import InputValidator
+from sympy import Symbol, Function, Derivative, Matrix, dsolve
+
+# y' / y'' / y(x)' / y'(x) -- a name followed by one or more primes
+PRIME_PATTERN = re.compile(
+    r"\b(?P<name>[A-Za-z_]\w*)(?:\((?P<arg>[A-Za-z_]\w*)\))?(?P<primes>'+)(?:\((?P<arg2>[A-Za-z_]\w*)\))?"
+)
+# Initial condition such as y(0) = 1 or y'(0) = 0
+CONDITION_PATTERN = re.compile(r"^(?P<name>[A-Za-z_]\w*)(?P<primes>'*)\((?P<at>[^()]+)\)\s*=\s*(?P<value>.+)$")
+
+IMPLICIT_METHODS = ('BDF', 'Radau', 'LSODA')
+METHODS = ('RK45', 'RK23', 'DOP853') + IMPLICIT_METHODS
+
+
+def expand_primes(text: str, var: str):
+    """
+    Rewrite prime notation as derivatives and bare function names as calls:
+    "y'' + y = 0" -> "Derivative(y(x), x, 2) + y(x) = 0". Returns the text
+    and the set of function names found.
+    """
+    names = set()
+    for match in PRIME_PATTERN.finditer(text):
+        names.add(match.group('name'))
+        for arg in (match.group('arg'), match.group('arg2')):
+            if arg and arg != var:
+                raise CommandError(f"'{match.group(0)}' differentiates with respect to {arg}, "
+                                   f"but the independent variable is {var} (use var={arg})")
+    text = PRIME_PATTERN.sub(
+        lambda m: f"Derivative({m.group('name')}({var}), {var}, {len(m.group('primes'))})", text
+    )
+    for name in names:
+        # Bare y -> y(x), leaving existing calls y(...) alone
+        text = re.sub(rf"\b{name}\b(?!\s*\()", f"{name}({var})", text)
+    return text, names
+
+
+class ODECommands(BaseCommand):
+    """Symbolic and numeric solution of ordinary differential equations."""
+
+    DEFAULT_POINTS = 101
+
+    def get_commands(self):
+        return {
+            'dsolve': self.cmd_dsolve,
+            'odeint': self.cmd_odeint,
+        }
+
+    def get_help(self):
+        return {
+            'dsolve': """
+DSOLVE: Solve an ordinary differential equation symbolically.
+
+Usage: dsolve <ode> [, var=x] [, ics=[y(0)=1, y'(0)=0]]
+
+Derivatives use prime notation, with or without the argument:
+  dsolve y'' + y = 0, ics=[y(0)=1, y'(0)=0]
+  dsolve y'(x) + y(x) = 0
+  dsolve f'(t) = -2*f(t), var=t
+""",
+            'odeint': """
+ODEINT: Integrate a first-order ODE system numerically.
+
+Usage: odeint "<x' = f1; v' = f2; ...>", t0, t1, y0 [, method=RK45|BDF|...]
+              [, out=traj.csv] [, points=N] [, t=t] [, rtol=..] [, atol=..]
+
+y0 is one initial state [1, 0] or a batch [[1, 0], [2, 0], ...] that is
+integrated as one vectorized system. The right-hand side is compiled
+once, as is its analytic Jacobian for the implicit methods (BDF, Radau,
+LSODA). With out=, N evenly spaced samples per run are streamed to CSV as
+the integration proceeds.
+""",
+        }
+
+    # ------------------------------------------------------------------
+    # dsolve
+    # ------------------------------------------------------------------
+    def cmd_dsolve(self, args: str):
+        validator = InputValidator()
+        parts, options = validator.split_options(validator.split_arguments(args), keys=('var', 'ics'))
+        if len(parts) != 1:
+            raise CommandError("Usage: dsolve <ode> [, var=x] [, ics=[y(0)=1, ...]]")
+
+        var_name = options.get('var', 'x')
+        text, names = expand_primes(parts[0], var_name)
+        if not names:
+            raise CommandError("No derivative found; write derivatives with primes, e.g. y''")
+        var = Symbol(var_name)
+        local = {var_name: var}
+        local.update({name: Function(name) for name in names})
+        ode = self.parser.parse(text, symbols=local)
+
+        ics = self._parse_conditions(options.get('ics'), var) if 'ics' in options else None
+        functions = [local[name](var) for name in sorted(names)]
+        target = functions[0] if len(functions) == 1 else functions
+        try:
+            solution = dsolve(ode, target, ics=ics)
+        except (NotImplementedError, ValueError) as e:
+            raise CommandError(f"Could not solve ODE: {e}")
+        self.formatter.display_result(solution, "ODE Solution")
+
+    def _parse_conditions(self, text: str, var: Symbol) -> dict:
+        text = text.strip()
+        if not (text.startswith('[') and text.endswith(']')):
+            raise CommandError("Initial conditions must be a list: ics=[y(0)=1, y'(0)=0]")
+        conditions = {}
+        for item in InputValidator().split_arguments(text[1:-1]):
+            match = CONDITION_PATTERN.match(item)
+            if not match:
+                raise CommandError(f"Invalid initial condition '{item}' (expected e.g. y'(0)=1)")
+            func = Function(match.group('name'))(var)
+            order = len(match.group('primes'))
+            at = self.parser.parse(match.group('at'))
+            key = Derivative(func, var, order).subs(var, at) if order else func.subs(var, at)
+            conditions[key] = self.parser.parse(match.group('value'))
+        return conditions
+
+    # ------------------------------------------------------------------
+    # odeint
+    # ------------------------------------------------------------------
+    def cmd_odeint(self, args: str):
+        try:
+            import numpy as np
+            import scipy.integrate as integrate
+            import scipy.sparse as sparse
+        except ImportError:
+            raise CommandError("odeint requires SciPy (pip install scipy)")
+
+        validator = InputValidator()
+        parts, options = validator.split_options(
+            validator.split_arguments(args),
+            keys=('method', 'out', 'points', 't', 'rtol', 'atol')
+        )
+        if len(parts) != 4:
+            raise CommandError('Usage: odeint "x\' = f; ...", t0, t1, y0 [, method=..] [, out=file.csv]')
+        system_text, t0_text, t1_text, y0_text = parts
+
+        method = self._method(options.get('method', 'RK45'))
+        t_name = options.get('t', 't')
+        states, rhs = self._parse_system(system_text.strip().strip('"\''), t_name)
+        n = len(states)
+        t0, t1 = (float(self.parser.parse(s)) for s in (t0_text, t1_text))
+        y0 = self._initial_states(y0_text, n)
+        m = len(y0)
+        points = int(options.get('points', self.DEFAULT_POINTS))
+        rtol = float(options.get('rtol', 1e-6))
+        atol = float(options.get('atol', 1e-9))
+
+        # Compile once; each state symbol receives the batch column of that state
+        t = Symbol(t_name)
+        f = compile_numpy([t] + states, rhs)
+
+        def fun(time, y):
+            Y = y.reshape(m, n)
+            values = f(time, *Y.T)
+            return np.column_stack([np.broadcast_to(v, (m,)) for v in values]).ravel()
+
+        jac = None
+        if method in IMPLICIT_METHODS:
+            J = compile_numpy([t] + states, Matrix(rhs).jacobian(states).tolist())
+            indices, indptr = np.arange(m), np.arange(m + 1)
+
+            def jac(time, y):
+                Y = y.reshape(m, n)
+                entries = J(time, *Y.T)
+                blocks = np.empty((m, n, n))
+                for i in range(n):
+                    for j in range(n):
+                        blocks[:, i, j] = entries[i][j]
+                # Batch members are independent: block-diagonal Jacobian
+                return sparse.bsr_matrix((blocks, indices, indptr), shape=(m * n, m * n))
+
+        solver_class = getattr(integrate, method)
+        kwargs = {'rtol': rtol, 'atol': atol}
+        if method == 'LSODA':
+            kwargs['jac'] = lambda time, y: jac(time, y).toarray()  # LSODA needs a dense matrix
+        elif jac is not None:
+            kwargs['jac'] = jac
+        solver = solver_class(fun, t0, y0.ravel(), t1, **kwargs)
+
+        samples = np.linspace(t0, t1, max(points, 2))
+        direction = 1.0 if t1 >= t0 else -1.0
+        out_path = options.get('out')
+        out = open(out_path, 'w') if out_path else None
+        try:
+            if out:
+                header = ['t'] + (['run'] if m > 1 else []) + [str(s) for s in states]
+                out.write(','.join(header) + '\n')
+                self._write_rows(out, samples[:1], y0.ravel()[:, None], m, n)
+            next_sample = 1
+            steps = 0
+            while solver.status == 'running':
+                message = solver.step()
+                steps += 1
+                if solver.status == 'failed':
+                    raise CommandError(f"Integration failed at t = {solver.t:.6g}: {message}")
+                if out:
+                    # Stream the samples covered by this step
+                    end = np.count_nonzero(direction * (samples - solver.t) <= 0)
+                    if end > next_sample:
+                        window = samples[next_sample:end]
+                        self._write_rows(out, window, solver.dense_output()(window), m, n)
+                        next_sample = end
+        finally:
+            if out:
+                out.close()
+
+        self._report(states, solver.y.reshape(m, n), solver.t, method, steps, solver.nfev,
+                     out_path, next_sample if out else None, m)
+
+    def _method(self, name: str) -> str:
+        for method in METHODS:
+            if method.lower() == name.lower():
+                return method
+        raise CommandError(f"Unknown method '{name}' (choose from {', '.join(METHODS)})")
+
+    def _parse_system(self, text: str, t_name: str):
+        """Parse "x' = f1; v' = f2" into state symbols and right-hand sides."""
+        states, rhs_texts = [], []
+        for line in (l.strip() for l in text.split(';')):
+            if not line:
+                continue
+            lhs, sep, rhs = line.partition('=')
+            match = re.fullmatch(r"\s*([A-Za-z_]\w*)'\s*", lhs)
+            if not sep or not match:
+                raise CommandError(f"Each equation must read <name>' = <expr>, got '{line}'")
+            if "'" in rhs:
+                raise CommandError("Only first-order systems are supported; introduce a variable per derivative")
+            states.append(match.group(1))
+            rhs_texts.append(rhs)
+        if not states:
+            raise CommandError("Empty ODE system")
+
+        names = states + [t_name]
+        rhs = [self.parser.parse(r, symbols=names) for r in rhs_texts]
+        symbols = [Symbol(s) for s in states]
+        unknown = set().union(*(r.free_symbols for r in rhs)) - set(symbols) - {Symbol(t_name)}
+        if unknown:
+            raise CommandError(f"Unknown symbol(s) in right-hand side: {', '.join(sorted(map(str, unknown)))}")
+        return symbols, rhs
+
+    def _initial_states(self, text: str, n: int):
+        """[1, 0] -> shape (1, n); [[1, 0], [2, 0]] -> shape (2, n)."""
+        import numpy as np
+
+        value = self.parser.parse(text)
+        try:
+            y0 = np.array(value.tolist() if hasattr(value, 'tolist') else value, dtype=float)
+        except (TypeError, ValueError):
+            raise CommandError(f"Initial state must be numeric: {text}")
+        y0 = np.atleast_2d(y0)
+        if y0.ndim != 2 or y0.shape[1] != n:
+            raise CommandError(f"Each initial state needs {n} values")
+        return y0
+
+    def _write_rows(self, out, times, values, m, n):
+        """Write sampled states (values has shape (m*n, len(times)))."""
+        import numpy as np
+
+        per_run = values.reshape(m, n, len(times))
+        lines = []
+        for k, time in enumerate(times):
+            for run in range(m):
+                row = [time] + ([run] if m > 1 else []) + list(per_run[run, :, k])
+                lines.append(','.join('%.15g' % v for v in row))
+        out.write('\n'.join(lines) + '\n')
+
+    def _report(self, states, final, t_end, method, steps, nfev, out_path, rows, m):
+        print(f"Integrated to t = {t_end:.6g} with {method}: {steps} steps, {nfev} RHS evaluations"
+              + (f" ({m} initial conditions)" if m > 1 else ""))
+        for run in range(m):
+            prefix = f"  run {run}: " if m > 1 else "  "
+            print(prefix + ', '.join(f"{s} = {v:.{self.formatter.precision}g}"
+                                     for s, v in zip(states, final[run])))
+        if out_path:
+            print(f"Wrote {rows} samples per run to {out_path}")
@@ -0,0 +1,175 @@
+"""
+Gradient-based minimization with symbolic derivatives compiled to NumPy.
+"""
+from .base_command import BaseCommand
+from core.compiler import compile_numpy
+from utils.exceptions import CommandError, EnvironmentError
+from utils.validation import InputValidator
+from sympy import Symbol, Float, hessian
+
+METHODS = ('L-BFGS-B', 'Newton-CG')
+
+
+class OptimizeCommands(BaseCommand):
+    """Local minimization of scalar expressions."""
+
+    def get_commands(self):
+        return {
+            'minimize': self.cmd_minimize,
+        }
+
+    def get_help(self):
+        return {
+            'minimize': """
+MINIMIZE: Find a local minimum of an expression.
+
+Usage: minimize <expr>, <vars>, <start> [, <bounds>] [, method=L-BFGS-B|Newton-CG] [, store]
+
+  minimize (x-1)^2 + 10*(y-x^2)^2, [x, y], [0, 0]
+  minimize x^4 - 3*x^2 + x, x, [[-2], [2]]             - multi-start
+  minimize x*y, [x, y], [1, 1], [(0, 2), (-1, oo)]    - bounds (L-BFGS-B)
+
+The gradient (and for Newton-CG the Hessian) is derived symbolically once
+and compiled together with the objective. A batch of start points runs one
+minimization per point and reports the best. With 'store' the optimal
+values are stored as variables.
+""",
+        }
+
+    def cmd_minimize(self, args: str):
+        try:
+            import numpy as np
+            from scipy.optimize import minimize
+        except ImportError:
+            raise CommandError("minimize requires SciPy (pip install scipy)")
+
+        validator = InputValidator()
+        parts, options = validator.split_options(
+            validator.split_arguments(args), flags=('store',), keys=('method',)
+        )
+        if len(parts) not in (3, 4):
+            raise CommandError("Usage: minimize <expr>, <vars>, <start> [, <bounds>] [, method=..] [, store]")
+
+        method = self._method(options.get('method', 'L-BFGS-B'))
+        variables = self._parse_variables(parts[1])
+        names = [v.name for v in variables]
+        expr = self.parser.parse(parts[0], symbols=names)
+        unknown = getattr(expr, 'free_symbols', set()) - set(variables)
+        if unknown:
+            raise CommandError(f"Unknown symbol(s) in objective: {', '.join(sorted(map(str, unknown)))}")
+        starts = self._parse_starts(parts[2], len(variables))
+        bounds = self._parse_bounds(parts[3], len(variables)) if len(parts) == 4 else None
+        if bounds and method != 'L-BFGS-B':
+            raise CommandError(f"{method} does not support bounds; use method=L-BFGS-B")
+
+        # Objective and gradient share one compiled function (and its CSE)
+        gradient = [expr.diff(v) for v in variables]
+        value_and_gradient = compile_numpy(variables, [expr] + gradient)
+
+        def fun(point):
+            values = value_and_gradient(*point)
+            return float(values[0]), np.array(values[1:], dtype=float)
+
+        kwargs = {'jac': True, 'method': method}
+        if bounds:
+            kwargs['bounds'] = bounds
+        if method == 'Newton-CG':
+            H = compile_numpy(variables, hessian(expr, variables).tolist())
+            kwargs['hess'] = lambda point: np.array(H(*point), dtype=float)
+
+        results = []
+        for start in starts:
+            try:
+                with np.errstate(all='ignore'):
+                    results.append(minimize(fun, start, **kwargs))
+            except (ValueError, ArithmeticError) as e:
+                raise CommandError(f"Minimization from {list(start)} failed: {e}")
+        finite = [r for r in results if np.isfinite(r.fun)]
+        if not finite:
+            raise CommandError("The objective is not finite at any optimum found")
+        best = min(finite, key=lambda r: r.fun)
+
+        self.formatter.display_result(Float(best.fun, self.formatter.precision), "Minimum")
+        digits = self.formatter.precision
+        print('  ' + ', '.join(f"{v} = {x:.{digits}g}" for v, x in zip(variables, best.x)))
+        if len(results) > 1:
+            self._report_starts(starts, results, best)
+        status = "converged" if best.success else f"did not converge ({best.message})"
+        print(f"{method}: {status} in {best.nit} iterations, {best.nfev} evaluations")
+
+        if options.get('store'):
+            try:
+                for v, x in zip(variables, best.x):
+                    self.env.store(v.name, Float(x, digits))
+            except EnvironmentError as e:
+                raise CommandError(str(e))
+            print(f"Stored {', '.join(names)}")
+
+    def _method(self, name: str) -> str:
+        for method in METHODS:
+            if method.lower() == name.lower():
+                return method
+        raise CommandError(f"Unknown method '{name}' (choose from {', '.join(METHODS)})")
+
+    def _parse_variables(self, text: str):
+        text = text.strip()
+        if text.startswith('[') and text.endswith(']'):
+            text = text[1:-1]
+        names = InputValidator().split_arguments(text)
+        if not names or not all(n.isidentifier() for n in names):
+            raise CommandError(f"Invalid variable list: {text}")
+        return [Symbol(n) for n in names]
+
+    def _parse_starts(self, text: str, n: int):
+        """[1, 2] is one start point; [[1, 2], [3, 4]] a batch (multi-start)."""
+        import numpy as np
+
+        value = self.parser.parse(text)
+        try:
+            starts = np.array(value.tolist() if hasattr(value, 'tolist') else value, dtype=float)
+        except (TypeError, ValueError):
+            raise CommandError(f"Start point must be numeric: {text}")
+        starts = np.atleast_2d(starts)
+        if n == 1 and starts.shape[0] == 1 and starts.shape[1] > 1:
+            starts = starts.T  # x, [-2, 2]: two starts for one variable
+        if starts.ndim != 2 or starts.shape[1] != n:
+            raise CommandError(f"Each start point needs {n} value(s)")
+        return starts
+
+    def _parse_bounds(self, text: str, n: int):
+        """[(lo, hi), ...] with None or +-oo for no bound."""
+        text = text.strip()
+        if not (text.startswith('[') and text.endswith(']')):
+            raise CommandError("Bounds must be a list: [(lo, hi), ...]")
+        validator = InputValidator()
+        pairs = validator.split_arguments(text[1:-1])
+        if len(pairs) != n:
+            raise CommandError(f"Give one (lo, hi) pair per variable ({n})")
+        bounds = []
+        for pair in pairs:
+            items = validator.split_arguments(pair.strip()[1:-1])
+            if len(items) != 2:
+                raise CommandError(f"Invalid bound '{pair}' (expected (lo, hi))")
+            bounds.append(tuple(self._bound(item) for item in items))
+        return bounds
+
+    def _bound(self, text: str):
+        if text.strip().lower() in ('none', ''):
+            return None
+        value = self.parser.parse(text)
+        if value.is_infinite:
+            return None
+        try:
+            return float(value)
+        except TypeError:
+            raise CommandError(f"Bound must be numeric: {text}")
+
+    def _report_starts(self, starts, results, best):
+        digits = min(self.formatter.precision, 8)
+        converged = sum(r.success for r in results)
+        print(f"Best of {len(results)} starts ({converged} converged):")
+        for start, result in zip(starts, results):
+            marker = '*' if result is best else ' '
+            point = ', '.join(f"{x:.{digits}g}" for x in result.x)
+            begin = ', '.join(f"{x:.{digits}g}" for x in start)
+            print(f" {marker} from [{begin}]: f = {result.fun:.{digits}g} at [{point}]")
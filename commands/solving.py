@@ -1,27 +1,50 @@
+import time
 from .base_command import BaseCommand
+from core.polynomial import to_polynomial, numeric_roots
+from core.verification import normalize_solutions
 from utils.exceptions import CommandError
-from sympy import solve, symbols
+from sympy import solve, symbols, Poly, Rational, Symbol, N
 from utils.validation import InputValidator
 
 class SolvingCommands(BaseCommand):
     """Equation solving commands."""
 
+    SQF_DEGREE = 200                   # Square-free split up front at or below this degree
+    INTERVAL_EPS = Rational(1, 10**10)  # Width of certified real-root intervals
+
     def get_commands(self):
         return {
             'solve': self.cmd_solve,
             'solve_system': self.cmd_solve_system,
+            'roots': self.cmd_roots,
         }
 
     def get_help(self):
         return {
-            'solve': "SOLVE: Solve an equation. Usage: solve <equation>, [var]",
+            'solve': "SOLVE: Solve an equation and verify the solutions. Usage: solve <equation>, [var] [, verify=off]",
             'solve_system': "SOLVE_SYSTEM: Solve system. Usage: solve_system \"eq1; eq2\" vars",
+            'roots': """
+ROOTS: All roots of a univariate polynomial, numerically.
+
+Usage: roots <polynomial>[, var] [, exact]
+
+Low degrees use companion-matrix eigenvalues, high degrees Aberth-Ehrlich
+iteration; both are polished with a Newton step. Repeated roots of exact
+(integer or rational) polynomials are found through a square-free
+decomposition and shown with their multiplicity. With 'exact', the real
+roots are additionally isolated in certified rational intervals.
+""",
         }
 
     def cmd_solve(self, args: str):
         if not args.strip():
-            raise CommandError("Usage: solve <equation>[, var]")
-        parts = [p.strip() for p in args.split(',') if p.strip()]
+            raise CommandError("Usage: solve <equation>[, var] [, verify=off]")
+        validator = InputValidator()
+        parts, options = validator.split_options(
+            [p for p in validator.split_arguments(args) if p], keys=('verify',)
+        )
+        if not parts:
+            raise CommandError("Usage: solve <equation>[, var] [, verify=off]")
         eq = self.parser.parse(parts[0])
         if len(parts) > 1:
             vars_ = symbols(parts[1])
@@ -30,6 +53,16 @@ class SolvingCommands(BaseCommand):
             solutions = solve(eq)
         self.formatter.display_result(solutions, "Solutions")
 
+        if options.get('verify', 'on').lower() in ('off', 'false', 'no', '0'):
+            return
+        if len(parts) > 1:
+            variables = list(vars_) if isinstance(vars_, tuple) else [vars_]
+        else:
+            variables = sorted(getattr(eq, 'free_symbols', set()), key=str)
+        branches = normalize_solutions(solutions, variables)
+        if branches:
+            self.formatter.format_verification([eq], branches)
+
     def cmd_solve_system(self, args: str):
         if not args.strip():
             raise CommandError("Usage: solve_system \"eq1; eq2\" vars")
@@ -48,18 +81,123 @@ class SolvingCommands(BaseCommand):
 
         self.formatter.display_result(solutions, "System Solutions")
 
-        # If solutions is a dict (or list[dict]) attempt verification
-        try:
-            if isinstance(solutions, dict):
-                self.formatter.format_verification(eqs, solutions)
-            elif isinstance(solutions, (list, tuple)) and len(solutions) == 1 and isinstance(solutions[0], dict):
-                self.formatter.format_verification(eqs, solutions[0])
-            else:
-                # Converter: try to pick a dict if possible
-                if isinstance(solutions, (list, tuple)):
-                    for sol in solutions:
-                        if isinstance(sol, dict):
-                            self.formatter.format_verification(eqs, sol)
-                            break
-        except Exception:
-            pass
+        # Verify every solution branch
+        branches = normalize_solutions(solutions, vars_)
+        if branches:
+            self.formatter.format_verification(eqs, branches)
+
+    def cmd_roots(self, args: str):
+        validator = InputValidator()
+        parts, options = validator.split_options(validator.split_arguments(args), flags=('exact',))
+        if not 1 <= len(parts) <= 2 or not parts[0]:
+            raise CommandError("Usage: roots <polynomial>[, var] [, exact]")
+
+        expr = self.parser.parse(parts[0])
+        if hasattr(expr, 'lhs'):
+            expr = expr.lhs - expr.rhs
+        free = sorted(getattr(expr, 'free_symbols', ()), key=str)
+        if len(parts) == 2:
+            var = Symbol(parts[1].strip())
+        elif len(free) == 1:
+            var = free[0]
+        else:
+            raise CommandError("Specify the variable: roots <polynomial>, <var>")
+        if set(free) - {var}:
+            raise CommandError(f"Coefficients must be numeric; found {', '.join(str(s) for s in free if s != var)}")
+
+        start = time.perf_counter()
+        poly = to_polynomial(expr) if free else None
+        if poly is not None:
+            degree = poly.degree()
+            dense = self._dense_coefficients(poly)
+        else:
+            try:
+                inexact = Poly(expr, var)
+            except Exception:
+                raise CommandError(f"Not a polynomial in {var}: {expr}")
+            degree = inexact.degree()
+            try:
+                dense = [complex(c) for c in inexact.all_coeffs()]
+            except TypeError:
+                raise CommandError("Coefficients must be numeric")
+        if degree < 1:
+            raise CommandError("Polynomial must have degree at least 1")
+
+        if poly is not None and degree <= self.SQF_DEGREE:
+            found = self._roots_by_factor(poly)
+        else:
+            result = numeric_roots(dense)
+            found = (result, [(r, 1) for r in result.roots])
+            if not result.converged and poly is not None:
+                # Slow convergence signals repeated roots: split them off exactly
+                found = self._roots_by_factor(poly)
+        result, roots = found
+        elapsed = time.perf_counter() - start
+
+        iterations = f", {result.iterations} iterations" if result.iterations else ""
+        print(f"Roots of degree-{degree} polynomial in {var} ({result.method}{iterations}, {elapsed * 1000:.1f} ms):")
+        real = 0
+        for root, multiplicity in self._sorted_roots(roots):
+            real += multiplicity if root.imag == 0 else 0
+            suffix = f"  (multiplicity {multiplicity})" if multiplicity > 1 else ""
+            print(f"  {var} = {self._format_root(root)}{suffix}")
+        print(f"{degree} roots ({real} real)")
+        if not result.converged:
+            print("Warning: some roots did not converge; they may be inaccurate")
+
+        if options.get('exact'):
+            self._print_intervals(expr, var, poly)
+
+    def _dense_coefficients(self, poly):
+        """Float coefficients of a univariate PolyElement, highest degree first."""
+        degree = poly.degree()
+        coeffs = [0.0] * (degree + 1)
+        for (k,), c in poly.terms():
+            coeffs[degree - k] = float(c)
+        return coeffs
+
+    def _roots_by_factor(self, poly):
+        """Roots of each square-free factor, tagged with its multiplicity."""
+        _, factors = poly.sqf_list()
+        roots, methods, iterations, converged = [], set(), 0, True
+        for factor, multiplicity in factors:
+            result = numeric_roots(self._dense_coefficients(factor))
+            roots.extend((r, multiplicity) for r in result.roots)
+            methods.add(result.method)
+            iterations = max(iterations, result.iterations)
+            converged = converged and result.converged
+        method = 'square-free split, ' + ' + '.join(sorted(methods))
+        return type(result)(None, method, iterations, converged), roots
+
+    def _sorted_roots(self, roots):
+        """Real roots ascending, then complex roots by real and imaginary part."""
+        cleaned = []
+        for root, multiplicity in roots:
+            scale = 1e-12 * max(1.0, abs(root))
+            real = root.real if abs(root.real) > scale else 0.0
+            imag = root.imag if abs(root.imag) > scale else 0.0
+            cleaned.append((complex(real, imag), multiplicity))
+        # Round the sort key so conjugate pairs stay together
+        return sorted(cleaned, key=lambda item: (item[0].imag != 0, round(item[0].real, 10), item[0].imag))
+
+    def _format_root(self, root: complex) -> str:
+        digits = self.formatter.precision
+        real, imag = root.real + 0.0, root.imag + 0.0  # + 0.0 turns -0.0 into 0.0
+        if imag == 0:
+            return f"{real:.{digits}g}"
+        sign = '-' if imag < 0 else '+'
+        imag_text = 'I' if abs(imag) == 1 else f"{abs(imag):.{digits}g}*I"
+        if real == 0:
+            return imag_text if imag > 0 else f"-{imag_text}"
+        return f"{real:.{digits}g} {sign} {imag_text}"
+
+    def _print_intervals(self, expr, var, poly):
+        """Certified isolating intervals for the real roots."""
+        if poly is None:
+            raise CommandError("'exact' needs integer or rational coefficients")
+        intervals = Poly(expr, var).intervals(eps=self.INTERVAL_EPS)
+        print(f"Certified real roots ({len(intervals)} distinct, intervals of width <= {float(self.INTERVAL_EPS):g}):")
+        for (a, b), multiplicity in intervals:
+            suffix = f"  (multiplicity {multiplicity})" if multiplicity > 1 else ""
+            middle = N((a + b) / 2, self.formatter.precision)
+            print(f"  [{a}, {b}]  ~ {middle}{suffix}")
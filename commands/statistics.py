@@ -1,4 +1,7 @@
 from .base_command import BaseCommand
+from core.arrays import is_array, moments
+from utils.exceptions import CommandError
+import math
 import statistics
 
 class StatisticsCommands(BaseCommand):
@@ -12,8 +15,8 @@ class StatisticsCommands(BaseCommand):
 
     def get_help(self):
         return {
-            'mean': "MEAN: Compute mean. Usage: mean <comma-separated numbers>",
-            'stdev': "STDEV: Compute standard deviation. Usage: stdev <comma-separated numbers>",
+            'mean': "MEAN: Compute mean. Usage: mean <comma-separated numbers> | mean <array expression>",
+            'stdev': "STDEV: Compute standard deviation. Usage: stdev <comma-separated numbers> | stdev <array expression>",
         }
 
     def _parse_numbers(self, argstr: str):
@@ -21,10 +24,30 @@ class StatisticsCommands(BaseCommand):
         nums = [float(self.parser.parse(t)) for t in tokens]
         return nums
 
+    def _array_moments(self, argstr: str):
+        """Chunked (count, mean, M2) if the argument is a single array expression."""
+        if ',' in argstr or not self.env.get_arrays():
+            return None
+        value = self.parser.parse_quantity(argstr)
+        return moments(value) if is_array(value) else None
+
     def cmd_mean(self, args: str):
+        stats = self._array_moments(args)
+        if stats is not None:
+            if not stats[0]:
+                raise CommandError("mean requires at least one data point")
+            self.formatter.display_result(stats[1], "Mean")
+            return
         nums = self._parse_numbers(args)
         self.formatter.display_result(statistics.mean(nums), "Mean")
 
     def cmd_stdev(self, args: str):
+        stats = self._array_moments(args)
+        if stats is not None:
+            count, _, m2 = stats
+            if count < 2:
+                raise CommandError("stdev requires at least two data points")
+            self.formatter.display_result(math.sqrt(m2 / (count - 1)), "Std Dev")
+            return
         nums = self._parse_numbers(args)
         self.formatter.display_result(statistics.stdev(nums), "Std Dev")
@@ -0,0 +1,232 @@
+"""
+Parameter sweeps: one symbolic solve/integrate/simplify, many parameter values.
+"""
+import os
+import re
+from .base_command import BaseCommand
+from core.compiler import compile_numpy
+from core.simplifier import budgeted_simplify
+from utils.datafiles import parse_file_reference, load_csv_columns
+from utils.exceptions import CommandError
+from utils.validation import InputValidator
+from sympy import Symbol, Integral, N, solve, integrate
+from sympy.polys.rootoftools import ComplexRootOf
+
+PARAMETER_PATTERN = re.compile(r'^(?P<name>[A-Za-z_]\w*)\s*=\s*(?P<values>[\[@].*)$')
+
+
+def _solve_instance(task):
+    """Pool worker: numeric solutions of one instance."""
+    equation, var, param, value = task
+    try:
+        return [N(s) for s in solve(equation.subs(param, value), var)]
+    except Exception as e:
+        return e
+
+
+def _integrate_instance(task):
+    """Pool worker: definite integrals numerically, indefinite symbolically."""
+    expr, var, limits, param, value = task
+    try:
+        instance = expr.subs(param, value)
+        if limits:
+            return N(Integral(instance, (var,) + tuple(l.subs(param, value) for l in limits)))
+        return integrate(instance, var)
+    except Exception as e:
+        return e
+
+
+class SweepCommands(BaseCommand):
+    """Solve, integrate or simplify over many values of a parameter."""
+
+    VARIANTS = ('solve', 'integrate', 'simplify')
+
+    def get_commands(self):
+        return {
+            'sweep': self.cmd_sweep,
+        }
+
+    def get_help(self):
+        return {
+            'sweep': """
+SWEEP: Repeat solve, integrate or simplify over many parameter values.
+
+Usage:
+  sweep solve <equation>, <var>, <p>=<values> [, workers=N]
+  sweep integrate <expr>, <var> [, <a>, <b>], <p>=<values> [, workers=N]
+  sweep simplify <expr>, <p>=<values>
+
+<values> is a list such as [0.5, 1, 2] or a data column @file.csv[col].
+The problem is first solved symbolically in terms of p and the closed
+form is evaluated for all values at once. Otherwise the instances are
+spread across a process pool. Results are printed in input order.
+""",
+        }
+
+    def cmd_sweep(self, args: str):
+        variant, _, rest = args.strip().partition(' ')
+        variant = variant.lower()
+        if variant not in self.VARIANTS:
+            raise CommandError(f"Usage: sweep {'|'.join(self.VARIANTS)} <expr>, ..., <p>=<values>")
+
+        validator = InputValidator()
+        parts, options = validator.split_options(validator.split_arguments(rest), keys=('workers',))
+        param_index = next((i for i, p in enumerate(parts) if PARAMETER_PATTERN.match(p)), None)
+        if param_index is None:
+            raise CommandError("Give the parameter values as <p>=[v1, v2, ...] or <p>=@file.csv[col]")
+        match = PARAMETER_PATTERN.match(parts.pop(param_index))
+        param = Symbol(match.group('name'))
+        values = self._parse_values(match.group('values'))
+        try:
+            workers = int(options.get('workers', os.cpu_count() or 1))
+        except ValueError:
+            raise CommandError(f"Invalid workers value: {options['workers']}")
+
+        if not parts:
+            raise CommandError(f"Missing expression for sweep {variant}")
+        # Keep the parameter symbolic even if a variable of that name is stored
+        expr = self.parser.parse(parts[0], symbols=[param.name])
+        getattr(self, f"_sweep_{variant}")(expr, parts[1:], param, values, max(1, workers))
+
+    def _parse_values(self, text: str):
+        """Exact values from a [..] list, or floats from a data column."""
+        text = text.strip()
+        if text.startswith('@'):
+            path, column = parse_file_reference(text)
+            if column is None:
+                raise CommandError("Specify a column: @file.csv[column]")
+            return list(load_csv_columns(path, [column])[column])
+        if not text.endswith(']'):
+            raise CommandError("Parameter values must be a [..] list or @file.csv[column]")
+        items = InputValidator().split_arguments(text[1:-1])
+        if not items:
+            raise CommandError("Empty list of parameter values")
+        return [self.parser.parse(item) for item in items]
+
+    # ------------------------------------------------------------------
+    # Variants
+    # ------------------------------------------------------------------
+    def _sweep_solve(self, equation, parts, param, values, workers):
+        if len(parts) != 1:
+            raise CommandError("Usage: sweep solve <equation>, <var>, <p>=<values>")
+        var = Symbol(parts[0])
+
+        try:
+            closed = solve(equation, var)
+        except (NotImplementedError, ValueError):
+            closed = []
+        if closed and not any(s.has(ComplexRootOf) for s in closed):
+            print(f"Closed form: {var} = {', '.join(str(s) for s in closed)}")
+            if set().union(*(s.free_symbols for s in closed)) <= {param}:
+                self._print_vectorized(param, values, closed)
+            else:
+                self._print_substituted(param, values, closed)
+            return
+
+        tasks = [(equation, var, param, v) for v in values]
+        self._print_pooled(param, values, _solve_instance, tasks, workers)
+
+    def _sweep_integrate(self, expr, parts, param, values, workers):
+        if len(parts) not in (1, 3):
+            raise CommandError("Usage: sweep integrate <expr>, <var> [, <a>, <b>], <p>=<values>")
+        var = Symbol(parts[0])
+        limits = tuple(self.parser.parse(p, symbols=[param.name]) for p in parts[1:])
+
+        try:
+            closed = integrate(expr, (var,) + limits) if limits else integrate(expr, var)
+        except NotImplementedError:
+            closed = None
+        if closed is not None and not closed.has(Integral):
+            print(f"Closed form: {closed}")
+            if closed.free_symbols <= {param}:
+                self._print_vectorized(param, values, [closed])
+            else:
+                self._print_substituted(param, values, closed)
+            return
+
+        tasks = [(expr, var, limits, param, v) for v in values]
+        self._print_pooled(param, values, _integrate_instance, tasks, workers)
+
+    def _sweep_simplify(self, expr, parts, param, values, workers):
+        if parts:
+            raise CommandError("Usage: sweep simplify <expr>, <p>=<values>")
+        simplified = budgeted_simplify(expr).expr
+        print(f"Closed form: {simplified}")
+        if simplified.free_symbols <= {param}:
+            self._print_vectorized(param, values, [simplified])
+        else:
+            self._print_substituted(param, values, simplified)
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+    def _print_vectorized(self, param, values, exprs):
+        """Evaluate closed forms for all parameter values in one call."""
+        import numpy as np
+
+        points = np.array([complex(v) for v in values])
+        try:
+            with np.errstate(all='ignore'):
+                outputs = compile_numpy([param], exprs)(points)
+            columns = [np.broadcast_to(np.asarray(o, dtype=complex), points.shape) for o in outputs]
+            mode = 'vectorized'
+        except Exception:
+            # Functions NumPy has no counterpart for (LambertW, ...): evaluate point by point
+            columns = [[self._evaluate(e, param, v) for v in values] for e in exprs]
+            mode = 'evaluated per value'
+        for k, value in enumerate(values):
+            row = ', '.join(self._format_number(column[k]) for column in columns)
+            print(f"  {param} = {self._format_parameter(value)}: {row}")
+        print(f"{len(values)} values (closed form, {mode})")
+
+    def _evaluate(self, expr, param, value) -> complex:
+        try:
+            return complex(N(expr.xreplace({param: value})))
+        except (TypeError, ValueError):
+            return complex('nan')
+
+    def _print_substituted(self, param, values, exprs):
+        """Closed form(s) still depend on other symbols: substitute each value."""
+        exprs = exprs if isinstance(exprs, list) else [exprs]
+        for value in values:
+            row = ', '.join(str(e.xreplace({param: value})) for e in exprs)
+            print(f"  {param} = {self._format_parameter(value)}: {row}")
+        print(f"{len(values)} values (closed form)")
+
+    def _print_pooled(self, param, values, worker, tasks, workers):
+        """Run instances in a process pool, printing results in input order."""
+        from concurrent.futures import ProcessPoolExecutor
+
+        print(f"No closed form; solving {len(tasks)} instances on {workers} worker(s)")
+        chunksize = max(1, len(tasks) // (workers * 4))
+        failures = 0
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for value, result in zip(values, pool.map(worker, tasks, chunksize=chunksize)):
+                if isinstance(result, Exception):
+                    failures += 1
+                    text = f"error: {result}"
+                elif isinstance(result, list):
+                    text = ', '.join(self._format_number(complex(r)) if r.is_number else str(r)
+                                     for r in result) or 'no solution'
+                else:
+                    text = self._format_number(complex(result)) if result.is_number else str(result)
+                print(f"  {param} = {self._format_parameter(value)}: {text}")
+        note = f", {failures} failed" if failures else ""
+        print(f"{len(tasks)} values (process pool{note})")
+
+    def _format_parameter(self, value) -> str:
+        """Exact values as written; floats (including data columns) to display precision."""
+        if getattr(value, 'is_Float', True):
+            return f"{float(value):.{self.formatter.precision}g}"
+        return str(value)
+
+    def _format_number(self, value: complex) -> str:
+        import numpy as np
+
+        digits = self.formatter.precision
+        if not np.isfinite(value):
+            return 'undefined'
+        real, imag = value.real + 0.0, value.imag + 0.0  # + 0.0 turns -0.0 into 0.0
+        if abs(imag) <= 1e-12 * max(1.0, abs(real)):
+            return f"{real:.{digits}g}"
+        return f"{real:.{digits}g}{imag:+.{digits}g}j"
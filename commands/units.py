@@ -1,9 +1,15 @@
+import itertools
+import sys
 from .base_command import BaseCommand
-from utils.exceptions import ConversionError
+from utils.datafiles import parse_file_reference, iter_csv_column_chunks
+from utils.exceptions import ConversionError, DataError
+from utils.units import get_unit_registry, conversion_coefficients, convert_array
 
 class UnitCommands(BaseCommand):
     """Unit conversion and management commands."""
 
+    CHUNK_ROWS = 1_000_000  # Rows converted and written per chunk in bulk mode
+
     def get_commands(self):
         return {
             'convert': self.cmd_convert,
@@ -11,18 +17,72 @@ class UnitCommands(BaseCommand):
 
     def get_help(self):
         return {
-            'convert': "CONVERT: Convert units. Usage: convert <value and units> to <unit>",
+            'convert': """
+CONVERT: Convert units.
+
+Usage:
+  convert <value and units> to <unit>
+  convert @<file.csv>[<column>] <unit> to <unit> [> <output.csv>]
+
+The file form converts a whole column in chunks and writes the results
+to the output file (or prints them if no output file is given).
+""",
         }
 
     def cmd_convert(self, args: str):
+        if ' to ' not in args:
+            raise ConversionError("Usage: convert <value and units> to <unit>")
+        value_str, unit_str = args.split(' to ', 1)
+
+        if value_str.strip().startswith('@'):
+            self._convert_column(value_str.strip(), unit_str.strip())
+            return
+
         try:
-            from pint import UnitRegistry
-            ureg = UnitRegistry()
-            if ' to ' not in args:
-                raise ConversionError("Usage: convert <value and units> to <unit>")
-            value_str, unit_str = args.split(' to ', 1)
+            ureg = get_unit_registry()
             value = ureg(value_str.strip())
             converted = value.to(unit_str.strip())
             print(f"{value} = {converted}")
         except Exception as e:
             raise ConversionError(str(e))
+
+    def _convert_column(self, source: str, target: str):
+        """Convert a CSV column with one vectorized operation per chunk."""
+        import numpy as np
+
+        output_path = None
+        if '>' in target:
+            target, output_path = (s.strip() for s in target.split('>', 1))
+
+        reference, _, from_unit = source.partition(']')
+        from_unit = from_unit.strip()
+        if not from_unit:
+            raise ConversionError("Give the unit of the column: convert @file.csv[col] <unit> to <unit>")
+        path, column = parse_file_reference(reference + ']')
+        if column is None:
+            raise ConversionError("Specify a column: @file.csv[column]")
+
+        # Resolve the conversion once; every chunk is then a multiply-add
+        factor, offset = conversion_coefficients(from_unit, target)
+        chunks = iter_csv_column_chunks(path, column, self.CHUNK_ROWS)
+        # Parse the first chunk before creating the output, so bad input leaves no empty file
+        first = next(chunks, None)
+        chunks = itertools.chain([first], chunks) if first is not None else iter(())
+
+        out = open(output_path, 'w') if output_path else sys.stdout
+        rows = 0
+        try:
+            out.write(f"{column} [{target}]\n")
+            for chunk in chunks:
+                converted = convert_array(chunk, from_unit, target)
+                np.savetxt(out, converted, fmt='%.15g')
+                rows += len(chunk)
+        except OSError as e:
+            raise DataError(f"Could not write converted data: {e}")
+        finally:
+            if output_path:
+                out.close()
+
+        destination = f" to {output_path}" if output_path else ""
+        print(f"Converted {rows} values of '{column}' from {from_unit} to {target}{destination} "
+              f"(x * {factor:.15g} + {offset:.15g})")
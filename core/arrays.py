@@ -0,0 +1,257 @@
+"""
+Array-valued variables backed by memory-mapped NumPy files.
+
+ArrayVariable wraps a read-only memmap of a .npy file (CSV columns are
+converted once to a .npy in the user's cache directory). ArrayExpression
+is an expression over array variables that is compiled once and evaluated
+lazily, chunk by chunk, with NumPy broadcasting, so the data is never
+copied into memory as a whole. Both pickle by reference (file paths and expressions), which
+keeps checkpoints small.
+"""
+import glob
+import hashlib
+import os
+import shutil
+import tempfile
+from typing import Dict, Iterator, Optional, Tuple
+from utils.datafiles import iter_csv_column_chunks
+from utils.exceptions import DataError
+
+CHUNK_ROWS = 1_000_000  # Rows evaluated per chunk
+PREVIEW_ITEMS = 3       # Leading/trailing elements shown when displaying arrays
+
+
+class ArrayVariable:
+    """A read-only, memory-mapped array loaded from a .npy file or CSV column."""
+
+    def __init__(self, path: str, column: Optional[str] = None):
+        self.path = path
+        self.column = column
+        self.data = self._open()
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.data.shape
+
+    def __len__(self) -> int:
+        return self.data.shape[0] if self.data.shape else 1
+
+    def describe(self) -> str:
+        source = f"{self.path}[{self.column}]" if self.column else self.path
+        return f"{self.data.dtype}{list(self.shape)} from {source}"
+
+    def evaluate(self, start: int, stop: int):
+        """Rows start:stop as a view of the mapped file."""
+        return self.data[start:stop]
+
+    def chunks(self, chunk_rows: int = CHUNK_ROWS) -> Iterator:
+        for start in range(0, len(self), chunk_rows):
+            yield self.data[start:start + chunk_rows]
+
+    def _open(self):
+        import numpy as np
+
+        npy_path = _csv_cache(self.path, self.column) if self.column else self.path
+        try:
+            data = np.load(npy_path, mmap_mode='r', allow_pickle=False)
+        except (OSError, ValueError) as e:
+            raise DataError(f"Could not map '{npy_path}': {e}")
+        if data.ndim == 0:
+            raise DataError(f"'{npy_path}' holds a scalar, not an array")
+        return data
+
+    def __getstate__(self):
+        return {'path': self.path, 'column': self.column}
+
+    def __setstate__(self, state):
+        self.path = state['path']
+        self.column = state['column']
+        self.data = self._open()
+
+
+class ArrayExpression:
+    """A SymPy expression over array variables, evaluated lazily in chunks."""
+
+    def __init__(self, expr, arrays: Dict):
+        # Inline other array expressions so every leaf is an ArrayVariable
+        leaves, replacements = {}, {}
+        for symbol, value in arrays.items():
+            if isinstance(value, ArrayExpression):
+                replacements[symbol] = value.expr
+                leaves.update(value.leaves)
+            else:
+                leaves[symbol] = value
+        self.expr = expr.xreplace(replacements) if replacements else expr
+        self.leaves = {s: a for s, a in leaves.items() if s in self.expr.free_symbols}
+        self._func = None
+
+        lengths = {len(a) for a in self.leaves.values()} - {1}
+        if len(lengths) > 1:
+            raise DataError(f"Array lengths differ: {', '.join(map(str, sorted(lengths)))}")
+        self.length = lengths.pop() if lengths else 1
+
+        unknown = self.expr.free_symbols - set(self.leaves)
+        if unknown:
+            raise DataError(f"Array expression has free symbol(s) {', '.join(sorted(map(str, unknown)))}")
+
+    def __len__(self) -> int:
+        return self.length
+
+    def describe(self) -> str:
+        return f"{self.expr} over {self.length} rows"
+
+    def evaluate(self, start: int, stop: int):
+        """Evaluate rows start:stop; inputs are sliced views, not copies."""
+        import numpy as np
+        from core.compiler import compile_numpy
+
+        if self._func is None:
+            self._func = compile_numpy(list(self.leaves), self.expr)
+        args = [a.data[start:stop] if len(a) == self.length else a.data
+                for a in self.leaves.values()]
+        rows = min(stop, self.length) - start
+        result = np.asarray(self._func(*args), dtype=float)
+        if result.ndim == 0 or result.shape[0] != rows:
+            result = np.broadcast_to(result, (rows,) + result.shape[1:] if result.ndim else (rows,))
+        return result
+
+    def chunks(self, chunk_rows: int = CHUNK_ROWS) -> Iterator:
+        for start in range(0, self.length, chunk_rows):
+            yield self.evaluate(start, start + chunk_rows)
+
+    def __getstate__(self):
+        return {'expr': self.expr, 'leaves': self.leaves, 'length': self.length}
+
+    def __setstate__(self, state):
+        self.expr = state['expr']
+        self.leaves = state['leaves']
+        self.length = state['length']
+        self._func = None
+
+
+def is_array(value) -> bool:
+    return isinstance(value, (ArrayVariable, ArrayExpression))
+
+
+def preview(array) -> str:
+    """First and last few elements, evaluating only those rows."""
+    import numpy as np
+
+    n = len(array)
+    k = PREVIEW_ITEMS
+    with np.printoptions(threshold=2 * k, formatter={'float_kind': lambda v: f'{v:.6g}'}):
+        if n <= 2 * k:
+            return np.array2string(np.asarray(array.evaluate(0, n)), separator=', ')
+        head = np.asarray(array.evaluate(0, k))
+        tail = np.asarray(array.evaluate(n - k, n))
+        inner = lambda a: np.array2string(a, separator=', ')[1:-1]
+        return f"[{inner(head)}, ..., {inner(tail)}]"
+
+
+def moments(array) -> Tuple[int, float, float]:
+    """(count, mean, sum of squared deviations) in one chunked pass (Chan et al.)."""
+    import numpy as np
+
+    count, mean, m2 = 0, 0.0, 0.0
+    for chunk in array.chunks():
+        chunk = np.asarray(chunk, dtype=float).ravel()
+        if not chunk.size:
+            continue
+        c_count, c_mean = chunk.size, float(chunk.mean())
+        c_m2 = float(((chunk - c_mean) ** 2).sum())
+        delta = c_mean - mean
+        total = count + c_count
+        mean += delta * c_count / total
+        m2 += c_m2 + delta * delta * count * c_count / total
+        count = total
+    return count, mean, m2
+
+
+def save_array(array, path: str) -> int:
+    """Write an array chunk by chunk to .npy (memmapped) or CSV; returns rows written."""
+    import numpy as np
+
+    n = len(array)
+    if path.lower().endswith('.npy'):
+        first = np.asarray(array.evaluate(0, min(n, 1)))
+        out = np.lib.format.open_memmap(path, mode='w+', dtype=float, shape=(n,) + first.shape[1:])
+        start = 0
+        for chunk in array.chunks():
+            out[start:start + len(chunk)] = chunk
+            start += len(chunk)
+        out.flush()
+        del out
+    else:
+        with open(path, 'w') as f:
+            for chunk in array.chunks():
+                chunk = np.asarray(chunk)
+                rows = chunk.reshape(len(chunk), -1)
+                f.write('\n'.join(','.join('%.15g' % v for v in row) for row in rows.tolist()) + '\n')
+    return n
+
+
+def _cache_directories():
+    """User cache directory first, then the system temp directory."""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return [os.path.join(base, 'symcalc', 'arrays'),
+            os.path.join(tempfile.gettempdir(), 'symcalc-cache')]
+
+
+def _csv_cache(path: str, column: str) -> str:
+    """
+    Path of a .npy copy of a CSV column, built if missing. Caches live in a
+    cache directory, never beside the data, keyed on the CSV's absolute
+    path and column plus its mtime and size; versions made stale by an edit
+    are deleted when the new one is written.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError as e:
+        raise DataError(f"Could not read '{path}': {e}")
+    key = hashlib.sha256(f"{os.path.abspath(path)}\0{column}".encode()).hexdigest()[:24]
+    cache_name = f"{key}-{stat.st_mtime_ns}-{stat.st_size}.npy"
+
+    directories = _cache_directories()
+    for directory in directories:
+        candidate = os.path.join(directory, cache_name)
+        if os.path.exists(candidate):
+            return candidate
+
+    for directory in directories:
+        candidate = os.path.join(directory, cache_name)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            _write_csv_column_npy(path, column, candidate)
+        except OSError:
+            continue
+        for stale in glob.glob(os.path.join(directory, f"{key}-*.npy")):
+            if stale != candidate:
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+        return candidate
+    raise DataError(f"Could not write a cache file for '{path}[{column}]'")
+
+
+def _write_csv_column_npy(path: str, column: str, npy_path: str) -> None:
+    """Parse the column once in chunks: raw float64 data first, then header + data."""
+    import numpy as np
+
+    raw_path = npy_path + '.raw'
+    count = 0
+    try:
+        with open(raw_path, 'wb') as raw:
+            for chunk in iter_csv_column_chunks(path, column, CHUNK_ROWS):
+                np.asarray(chunk, dtype='<f8').tofile(raw)
+                count += len(chunk)
+        with open(npy_path + '.tmp', 'wb') as out, open(raw_path, 'rb') as raw:
+            np.lib.format.write_array_header_1_0(
+                out, {'descr': '<f8', 'fortran_order': False, 'shape': (count,)}
+            )
+            shutil.copyfileobj(raw, out, 1 << 20)
+        os.replace(npy_path + '.tmp', npy_path)
+    finally:
+        for leftover in (raw_path, npy_path + '.tmp'):
+            if os.path.exists(leftover):
+                os.remove(leftover)
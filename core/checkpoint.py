@@ -0,0 +1,118 @@
+"""
+Checkpoints and run logs for resumable batch script runs.
+"""
+import csv
+import hashlib
+import os
+import pickle
+import time
+from typing import Optional
+
+class CheckpointManager:
+    """Snapshots the environment and script position to a checkpoint directory."""
+
+    CHECKPOINT_FILE = 'checkpoint.pkl'
+    RUN_LOG_FILE = 'run_log.csv'
+    FORMAT_VERSION = 1
+
+    def __init__(self, directory: str, script_path: str, interval: float = 60.0):
+        self.directory = directory
+        self.interval = interval
+        self.script_hash = self.hash_script(script_path)
+        self._last_save = time.monotonic()
+        self._run_started = time.strftime('%Y-%m-%dT%H:%M:%S')
+        os.makedirs(directory, exist_ok=True)
+
+        log_path = os.path.join(directory, self.RUN_LOG_FILE)
+        new_log = not os.path.exists(log_path)
+        self._log_file = open(log_path, 'a', newline='')
+        self._log = csv.writer(self._log_file)
+        if new_log:
+            self._log.writerow(['run_started', 'line', 'seconds', 'status', 'command'])
+
+    @staticmethod
+    def hash_script(path: str) -> str:
+        """SHA-256 of the script contents."""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 16), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @property
+    def checkpoint_path(self) -> str:
+        return os.path.join(self.directory, self.CHECKPOINT_FILE)
+
+    def load(self) -> Optional[dict]:
+        """Return the last checkpoint for this script, or None if unusable."""
+        try:
+            with open(self.checkpoint_path, 'rb') as f:
+                state = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Ignoring unreadable checkpoint: {e}")
+            return None
+
+        if state.get('version') != self.FORMAT_VERSION:
+            print("Ignoring checkpoint from an incompatible version")
+            return None
+        if state.get('script_hash') != self.script_hash:
+            print("Ignoring checkpoint: script has changed since it was written")
+            return None
+        return state
+
+    def save(self, line_num: int, environment, formatter) -> bool:
+        """Atomically write a checkpoint after line_num. Returns False on failure."""
+        state = {
+            'version': self.FORMAT_VERSION,
+            'script_hash': self.script_hash,
+            'line': line_num,
+            'saved_at': time.time(),
+            'variables': environment.list_variables(),
+            'history': environment.history.snapshot(),
+            'formatter': {
+                'precision': formatter.precision,
+                'adaptive': formatter.adaptive,
+                'show_error_bound': formatter.show_error_bound,
+                'verbose': formatter.verbose,
+            },
+        }
+        temp_path = self.checkpoint_path + '.tmp'
+        try:
+            with open(temp_path, 'wb') as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.checkpoint_path)
+        except Exception as e:
+            print(f"Warning: checkpoint after line {line_num} failed: {e}")
+            return False
+
+        self._last_save = time.monotonic()
+        return True
+
+    def maybe_save(self, line_num: int, environment, formatter) -> None:
+        """Save if the checkpoint interval has elapsed."""
+        if time.monotonic() - self._last_save >= self.interval:
+            self.save(line_num, environment, formatter)
+
+    def restore(self, state: dict, environment, formatter) -> int:
+        """Apply a loaded checkpoint; returns the last completed line."""
+        environment.restore(state['variables'])
+        if 'history' in state:
+            environment.history.restore(state['history'])
+        settings = state.get('formatter', {})
+        formatter.precision = settings.get('precision', formatter.precision)
+        formatter.adaptive = settings.get('adaptive', formatter.adaptive)
+        formatter.show_error_bound = settings.get('show_error_bound', formatter.show_error_bound)
+        formatter.verbose = settings.get('verbose', formatter.verbose)
+        return state['line']
+
+    def log_line(self, line_num: int, seconds: float, status: str, command: str) -> None:
+        """Append one line's timing to the run log."""
+        self._log.writerow([self._run_started, line_num, f"{seconds:.6f}", status, command])
+        self._log_file.flush()
+
+    def close(self) -> None:
+        self._log_file.close()
@@ -0,0 +1,22 @@
+"""
+Compilation of SymPy expressions into vectorized NumPy callables.
+"""
+from typing import Any, Sequence
+
+
+def compile_numpy(args: Sequence[Any], exprs: Any):
+    """
+    Compile expression(s) into a NumPy function of `args`. Common
+    subexpressions are eliminated once, at compile time.
+    """
+    from sympy import lambdify
+    return lambdify(list(args), exprs, modules='numpy', cse=True)
+
+
+def broadcast_columns(values: Sequence[Any], length: int):
+    """
+    Stack compiled outputs as columns of a (length, len(values)) array.
+    Constant outputs (scalars) are broadcast to full length.
+    """
+    import numpy as np
+    return np.column_stack([np.broadcast_to(np.asarray(v, dtype=float), (length,)) for v in values])
@@ -3,6 +3,7 @@ Variable storage and environment management.
 """
 import re
 from typing import Any, Dict
+from core.history import ResultHistory
 from utils.exceptions import EnvironmentError
 
 class Environment:
@@ -13,6 +14,7 @@ class Environment:
 
     def __init__(self):
         self._variables: Dict[str, Any] = {}
+        self.history = ResultHistory()
 
     def store(self, name: str, value: Any) -> None:
         """Store a variable."""
@@ -22,9 +24,18 @@ class Environment:
                 f"Must start with letter/underscore, contain only letters/digits/underscores."
             )
 
-        if len(self._variables) >= self.MAX_VARIABLES:
+        if len(self._variables) >= self.MAX_VARIABLES and name not in self._variables:
             raise EnvironmentError(f"Maximum {self.MAX_VARIABLES} variables exceeded")
 
+        # Resolve pint quantities to SI once, at store time
+        if hasattr(value, 'units') and hasattr(value, 'magnitude'):
+            from core.quantity import SIQuantity
+            from utils.exceptions import DimensionError
+            try:
+                value = SIQuantity.from_pint(value)
+            except DimensionError as e:
+                raise EnvironmentError(f"Cannot store '{name}': {e}")
+
         self._variables[name] = value
 
     def get(self, name: str) -> Any:
@@ -51,26 +62,49 @@ class Environment:
         """Get all variables."""
         return self._variables.copy()
 
+    def restore(self, variables: Dict[str, Any]) -> None:
+        """Replace all variables with a previously taken snapshot."""
+        self._variables = dict(variables)
+
     def get_symbol_dict(self) -> Dict[str, Any]:
-        """Get variables formatted for SymPy parsing."""
+        """
+        Get variables formatted for SymPy parsing (unit quantities as SI
+        magnitudes, array variables as symbols of the same name).
+        """
         from sympy import Symbol
+        from core.arrays import is_array
+        from core.quantity import SIQuantity
 
         result = {}
         for name, value in self._variables.items():
             if not self._is_valid_name(name):
                 continue
 
-            # Handle pint quantities
-            if hasattr(value, 'units') and hasattr(value, 'magnitude'):
-                try:
-                    result[name] = float(value.magnitude)
-                except:
-                    result[name] = value.magnitude
+            if isinstance(value, SIQuantity):
+                result[name] = value.magnitude
+            elif is_array(value):
+                result[name] = Symbol(name)
             else:
                 result[name] = value
 
         return result
 
+    def get_dimensions(self) -> Dict[str, tuple]:
+        """Get dimension vectors of the unit-valued variables."""
+        from core.quantity import SIQuantity
+
+        return {
+            name: value.dimensions
+            for name, value in self._variables.items()
+            if isinstance(value, SIQuantity) and not value.is_dimensionless
+        }
+
+    def get_arrays(self) -> Dict[str, Any]:
+        """Get the array-valued variables."""
+        from core.arrays import is_array
+
+        return {name: value for name, value in self._variables.items() if is_array(value)}
+
     def _is_valid_name(self, name: str) -> bool:
         """Validate variable name."""
         return bool(self.VALID_NAME_PATTERN.match(name))
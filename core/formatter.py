@@ -1,9 +1,14 @@
 """
 Dual-format output system (exact + decimal).
 """
-from typing import Any, Optional
-from sympy import N, nsimplify, pprint, Rational
+import contextlib
+import io
+from typing import Any, List, Optional, Tuple
+from sympy import N, nsimplify, pprint, Rational, Float
 from decimal import getcontext
+from core.arrays import is_array, preview
+from core.quantity import SIQuantity
+from core.verification import verify_solutions, FAILED, UNKNOWN
 
 # Set high precision for decimal operations
 getcontext().prec = 50
@@ -11,14 +16,50 @@ getcontext().prec = 50
 class OutputFormatter:
     """Handles all output formatting with exact + decimal display."""
 
-    def __init__(self, precision: int = 15):
+    MACHINE_DPS = 15        # Starting working precision (~53 bits)
+    MAX_WORKING_DPS = 1000  # Upper limit for adaptive evaluation
+    MAX_PRETTY_NODES = 2000 # Larger results are summarised instead of pretty-printed
+    SUMMARY_NODES = 40      # Subexpressions up to this size are shown in full in summaries
+    SUMMARY_TERMS = 4       # Leading terms/items shown per level of a summary
+
+    def __init__(self, precision: int = 15, history=None):
         self.precision = precision
+        self.history = history
+        self.adaptive = False
+        self.show_error_bound = False
+        self.verbose = False
+        self.size_limit = self.MAX_PRETTY_NODES
+        self.last_result = None
+        self.last_label = None
+        self._captured = None
 
-    def display_result(self, result: Any, label: Optional[str] = None) -> None:
-        """Display a result in both exact and decimal form when appropriate."""
+    def display_result(self, result: Any, label: Optional[str] = None, record: bool = True) -> None:
+        """
+        Display a result in both exact and decimal form when appropriate.
+        With a history attached, the result is recorded as out[n] unless record is False.
+        """
+        if self._captured is not None:
+            self._captured.append(result)
+            return
+        self.last_result, self.last_label = result, label
+        if record and self.history is not None:
+            number = self.history.record(result, self.estimate_size(result, self.history.max_nodes))
+            label = f"{label or 'Result'} (out[{number}])"
         if label:
             print(f"{label}:")
 
+        if isinstance(result, SIQuantity):
+            self._display_quantity(result)
+            return
+        if is_array(result):
+            self._display_array(result)
+            return
+
+        size = self.estimate_size(result, self.size_limit)
+        if size > self.size_limit:
+            self._display_summary(result)
+            return
+
         # Determine if we should show dual format
         should_show_dual = self._should_show_dual_format(result)
 
@@ -29,16 +70,209 @@ class OutputFormatter:
 
             # Show decimal approximation
             try:
-                decimal_result = N(result, self.precision)
+                if self.adaptive:
+                    decimal_result, error = self.adaptive_evalf(result, self.precision)
+                else:
+                    decimal_result, error = N(result, self.precision), None
                 if decimal_result != result:  # Only show if different
                     print("Decimal:")
                     self._pretty_print_with_indent(decimal_result)
+                    if self.show_error_bound and error is not None and error[0] != 0:
+                        bound, certified = error
+                        if certified:
+                            print(f"  (error <= {N(bound, 3)}, certified)")
+                        else:
+                            print(f"  (error ~ {N(bound, 3)}, estimated)")
             except Exception:
                 pass  # Skip decimal if conversion fails
         else:
             # Show single format
             self._pretty_print(result)
 
+    def _display_quantity(self, quantity: SIQuantity) -> None:
+        """Display a dimensional result in its preferred unit."""
+        magnitude = quantity.magnitude
+        if magnitude.is_number:
+            print(f"{N(magnitude, self.precision)} {quantity.unit_string()}")
+        else:
+            self._pretty_print(magnitude)
+            print(f"Units: {quantity.unit_string()}")
+
+    def _display_array(self, array) -> None:
+        """Display an array by its size and first/last elements; nothing else is evaluated."""
+        print(f"  {array.describe()}")
+        print(f"  {preview(array)}")
+
+    def adaptive_evalf(self, expr: Any, digits: int) -> Tuple[Any, Optional[Tuple[Any, bool]]]:
+        """
+        Evaluate numerically, starting at machine precision and raising the
+        mpmath working precision only until `digits` significant digits are stable.
+        Returns (value, error) where error is (bound, certified) or None;
+        exact rationals have no error beyond the rounding of the display.
+        """
+        if not hasattr(expr, 'free_symbols') or expr.free_symbols or not hasattr(expr, 'evalf'):
+            return N(expr, digits), None
+        if expr.is_Rational:
+            return N(expr, digits), None
+
+        enclosure = self._interval_function(expr)
+        tolerance = Float(10) ** -digits
+        previous = None
+        dps = self.MACHINE_DPS
+
+        while True:
+            if enclosure is not None:
+                try:
+                    result = self._evaluate_interval(enclosure, dps, digits)
+                except Exception:
+                    enclosure = None  # e.g. complex intermediate, use stability check
+                    continue
+                if result is not None:
+                    return result
+            else:
+                value = expr.evalf(dps)
+                if previous is not None:
+                    change = abs(value - previous)
+                    if change <= tolerance * abs(value) or dps >= self.MAX_WORKING_DPS:
+                        # Agreement between two precisions is a heuristic, not a bound
+                        return value.evalf(digits), (change, False) if change else None
+                previous = value
+
+            if dps >= self.MAX_WORKING_DPS:
+                return N(expr, digits), None
+            dps = min(2 * dps, self.MAX_WORKING_DPS)
+
+    def _interval_function(self, expr: Any):
+        """Compile expr to a callable over mpmath interval arithmetic, if supported."""
+        try:
+            import mpmath
+            from sympy import lambdify
+            from sympy.printing.pycode import MpmathPrinter
+
+            namespace = {n: getattr(mpmath.iv, n) for n in dir(mpmath.iv) if not n.startswith('_')}
+            namespace['mpmath'] = mpmath.iv
+            return lambdify([], expr, modules=[namespace], printer=MpmathPrinter)
+        except Exception:
+            return None
+
+    def _evaluate_interval(self, enclosure, dps: int, digits: int):
+        """
+        Evaluate an interval enclosure at `dps` working digits. Returns
+        (value, (bound, True)) once the enclosure is tight enough, else None.
+        """
+        import mpmath
+
+        saved = mpmath.iv.dps
+        mpmath.iv.dps = dps
+        try:
+            interval = enclosure()
+        finally:
+            mpmath.iv.dps = saved
+
+        if not isinstance(interval, mpmath.ctx_iv.ivmpf):
+            raise TypeError("Enclosure is not a real interval")
+
+        with mpmath.workdps(dps + 10):
+            lo, hi = mpmath.mpf(interval.a), mpmath.mpf(interval.b)
+            mid = (lo + hi) / 2
+            radius = (hi - lo) / 2
+            if radius <= mpmath.mpf(10) ** -digits * abs(mid):
+                return Float(mid, digits), (Float(radius, 3), True)
+            if dps >= self.MAX_WORKING_DPS and lo <= 0 <= hi:
+                # Indistinguishable from zero at the highest working precision
+                return Float(0), (Float(max(-lo, hi), 3), True)
+        return None
+
+    @contextlib.contextmanager
+    def capture(self):
+        """
+        Collect results passed to display_result instead of printing them;
+        any other output printed meanwhile (strategy lines, verification) is discarded.
+        """
+        previous, captured = self._captured, []
+        self._captured = captured
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                yield captured
+        finally:
+            self._captured = previous
+
+    def estimate_size(self, obj: Any, limit: int) -> int:
+        """Count expression tree nodes, stopping once the count exceeds limit."""
+        count = 0
+        stack = [obj]
+        while stack and count <= limit:
+            item = stack.pop()
+            count += 1
+            if isinstance(item, dict):
+                stack.extend(item.keys())
+                stack.extend(item.values())
+            elif isinstance(item, (list, tuple, set)):
+                stack.extend(item)
+            elif getattr(item, 'is_Matrix', False):
+                stack.extend(item)
+            elif getattr(item, 'args', None):
+                stack.extend(item.args)
+        return count
+
+    def _display_summary(self, result: Any) -> None:
+        """Abbreviated rendering of a result too large to pretty-print."""
+        print(f"  (result has more than {self.size_limit} nodes; showing a summary)")
+        print(f"  {self.summarize(result)}")
+        print("  Use 'show last full' to render it, or 'show last full > <file>' to save it.")
+
+    def summarize(self, obj: Any) -> str:
+        """One-line string form with large subexpressions elided."""
+        return self._abbreviate(obj, depth=0)
+
+    def _abbreviate(self, obj: Any, depth: int) -> str:
+        """String form with large subexpressions elided."""
+        size = self.estimate_size(obj, self.SUMMARY_NODES)
+        if size <= self.SUMMARY_NODES:
+            return str(obj)
+        if depth >= 3:
+            return f"<{type(obj).__name__}, {size}+ nodes>"
+
+        if isinstance(obj, dict):
+            items = [f"{self._abbreviate(k, depth + 1)}: {self._abbreviate(v, depth + 1)}"
+                     for k, v in list(obj.items())[:self.SUMMARY_TERMS]]
+            return '{' + self._join(items, ', ', len(obj), 'items') + '}'
+        if isinstance(obj, (list, tuple)):
+            items = [self._abbreviate(item, depth + 1) for item in obj[:self.SUMMARY_TERMS]]
+            return '[' + self._join(items, ', ', len(obj), 'items') + ']'
+
+        args = getattr(obj, 'args', ())
+        if getattr(obj, 'is_Add', False):
+            terms = [self._abbreviate(a, depth + 1) for a in args[:self.SUMMARY_TERMS]]
+            return self._join(terms, ' + ', len(args), 'terms')
+        if getattr(obj, 'is_Mul', False):
+            factors = [f"({self._abbreviate(a, depth + 1)})" for a in args[:self.SUMMARY_TERMS]]
+            return self._join(factors, '*', len(args), 'factors')
+        if args:
+            inner = [self._abbreviate(a, depth + 1) for a in args[:self.SUMMARY_TERMS]]
+            return f"{type(obj).__name__}({self._join(inner, ', ', len(args), 'args')})"
+        return f"<{type(obj).__name__}, {size}+ nodes>"
+
+    def _join(self, parts: List[str], separator: str, total: int, noun: str) -> str:
+        text = separator.join(parts)
+        if total > len(parts):
+            text += f"{separator}... ({total - len(parts)} more {noun})"
+        return text
+
+    def display_full(self, output_path: Optional[str] = None) -> None:
+        """Render the last result without the size budget, or write it to a file."""
+        if self.last_result is None:
+            print("No result to show")
+            return
+        if output_path:
+            with open(output_path, 'w') as f:
+                f.write(f"{self.last_result}\n")
+            print(f"Wrote last result to {output_path}")
+            return
+        if self.last_label:
+            print(f"{self.last_label}:")
+        self._pretty_print(self.last_result)
+
     def _should_show_dual_format(self, obj: Any) -> bool:
         """Determine if object should be shown in both exact and decimal forms."""
         try:
@@ -79,44 +313,42 @@ class OutputFormatter:
         except Exception:
             print(f"  {obj}")
 
-    def format_verification(self, equations: list, solutions: dict) -> None:
-        """Format equation verification results."""
+    def format_verification(self, equations: list, solutions) -> bool:
+        """
+        Verify solution branches (a dict or a list of dicts) against the
+        equations and print the outcome. Returns True if all were verified.
+        """
+        branches = [solutions] if isinstance(solutions, dict) else list(solutions)
+        checks = verify_solutions(equations, branches)
+
         print("\nVerification:")
         all_satisfied = True
-
-        for i, eq in enumerate(equations, 1):
-            try:
-                substituted = eq.subs(solutions)
-
-                # Check if equation is satisfied
-                if hasattr(substituted, 'equals') and substituted.equals(True):
-                    print(f"  Equation {i}: ✓ Satisfied")
-                else:
-                    # Calculate residual
-                    if hasattr(eq, 'lhs') and hasattr(eq, 'rhs'):
-                        residual = (eq.lhs - eq.rhs).subs(solutions)
-                    else:
-                        residual = substituted
-
-                    # Check if numerically zero
-                    try:
-                        residual_val = float(N(residual, 15))
-                        if abs(residual_val) < 1e-12:
-                            print(f"  Equation {i}: ✓ Satisfied")
-                        else:
-                            print(f"  Equation {i}: ✗ Residual = {residual}")
-                            all_satisfied = False
-                    except:
-                        if residual == 0:
-                            print(f"  Equation {i}: ✓ Satisfied")
-                        else:
-                            print(f"  Equation {i}: ? Residual = {residual}")
-
-            except Exception as e:
-                print(f"  Equation {i}: Could not verify - {e}")
+        for b, branch_checks in enumerate(checks, 1):
+            prefix = f"  Solution {b}: " if len(branches) > 1 else "  "
+            problems = []
+            for i, check in enumerate(branch_checks, 1):
+                if check.status == FAILED:
+                    problems.append(f"✗ Equation {i} residual = {N(check.residual, 3)}")
+                elif check.status == UNKNOWN:
+                    problems.append(f"? Equation {i} could not be verified")
+            if problems:
+                all_satisfied = False
+                for problem in problems:
+                    print(f"{prefix}{problem}")
+            else:
+                methods = sorted({c.method for c in branch_checks} - {'numeric'})
+                detail = f" ({', '.join(methods)})" if methods else ""
+                print(f"{prefix}✓ Satisfied{detail}")
 
         if all_satisfied:
             print("✓ All equations satisfied!")
+        return all_satisfied
+
+    def display_timing(self, label: str, stages: List[Tuple[str, float]]) -> None:
+        """Print per-stage timings in verbose mode."""
+        if self.verbose:
+            timings = ', '.join(f"{name} {seconds:.3f}s" for name, seconds in stages)
+            print(f"[{label}] {timings}")
 
     def set_precision(self, precision: int) -> None:
         """Set display precision."""
@@ -0,0 +1,189 @@
+"""
+Numbered result history kept as SymPy objects.
+
+Recent results stay in memory within an entry-count and total-size budget
+(size measured in expression nodes); older ones are pickled to a temporary
+directory and loaded back on demand. Beyond MAX_SPILLED, the oldest
+spilled entries are deleted.
+"""
+import atexit
+import os
+import pickle
+import shutil
+import tempfile
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from utils.exceptions import EnvironmentError
+
+
+class ResultHistory:
+    """Results addressable as out[n], with the most recent one as ans."""
+
+    MAX_ENTRIES = 100       # Results kept in memory
+    MAX_NODES = 500_000     # Total expression nodes kept in memory
+    MAX_SPILLED = 1000      # Results kept on disk before being discarded
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, max_nodes: int = MAX_NODES):
+        self.max_entries = max_entries
+        self.max_nodes = max_nodes
+        self.count = 0
+        self._memory: "OrderedDict[int, Tuple[Any, int]]" = OrderedDict()
+        self._spilled: "OrderedDict[int, str]" = OrderedDict()
+        self._spill_dir: Optional[str] = None
+
+    def record(self, value: Any, size: int) -> int:
+        """Store a result of `size` nodes; returns its number."""
+        self.count += 1
+        self._memory[self.count] = (value, size)
+        self._enforce_limits()
+        return self.count
+
+    def get(self, number: int) -> Any:
+        """Result number `number`, loading it from disk if it was spilled."""
+        if number in self._memory:
+            return self._memory[number][0]
+        if number in self._spilled:
+            with open(self._spilled[number], 'rb') as f:
+                return pickle.load(f)
+        if 1 <= number <= self.count:
+            raise EnvironmentError(f"out[{number}] has been discarded from the history")
+        raise EnvironmentError(f"No result out[{number}] (history has {self.count} results)")
+
+    @property
+    def last(self) -> Any:
+        if not self.count:
+            raise EnvironmentError("No previous result (ans)")
+        return self.get(self.count)
+
+    def entries(self) -> List[Tuple[int, str, Optional[Any], Optional[int]]]:
+        """(number, 'memory'|'disk', value or None, size or None), oldest first."""
+        listing = [(n, 'disk', None, None) for n in self._spilled]
+        listing += [(n, 'memory', value, size) for n, (value, size) in self._memory.items()]
+        return listing
+
+    @property
+    def memory_nodes(self) -> int:
+        return sum(size for _, size in self._memory.values())
+
+    def set_limits(self, max_entries: int, max_nodes: Optional[int] = None) -> None:
+        self.max_entries = max_entries
+        if max_nodes is not None:
+            self.max_nodes = max_nodes
+        self._enforce_limits()
+
+    def clear(self) -> None:
+        """Drop all results; numbering continues."""
+        self._memory.clear()
+        self._spilled.clear()
+        if self._spill_dir:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Picklable copy of the whole history for checkpoints. Values are kept
+        as pickled bytes (spilled ones straight from disk); results that
+        cannot be pickled are left out, as when spilling.
+        """
+        entries = []
+        for number, path in self._spilled.items():
+            try:
+                with open(path, 'rb') as f:
+                    entries.append((number, None, f.read()))
+            except OSError:
+                continue
+        for number, (value, size) in self._memory.items():
+            try:
+                entries.append((number, size, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)))
+            except Exception:
+                continue
+        return {'count': self.count, 'max_entries': self.max_entries,
+                'max_nodes': self.max_nodes, 'entries': entries}
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        """Replace the history with a snapshot; spilled entries go back to disk."""
+        self.clear()
+        self.count = state['count']
+        self.max_entries = state['max_entries']
+        self.max_nodes = state['max_nodes']
+        for number, size, data in state['entries']:
+            if size is None:
+                self._spill_bytes(number, data)
+            else:
+                self._memory[number] = (pickle.loads(data), size)
+
+    def _enforce_limits(self) -> None:
+        # The newest result always stays in memory so ans is cheap
+        while len(self._memory) > 1 and (
+            len(self._memory) > self.max_entries or self.memory_nodes > self.max_nodes
+        ):
+            number, (value, _) = self._memory.popitem(last=False)
+            self._spill(number, value)
+
+        while len(self._spilled) > self.MAX_SPILLED:
+            _, path = self._spilled.popitem(last=False)
+            self._remove(path)
+
+    def _spill(self, number: int, value: Any) -> None:
+        """Pickle a result to disk; unpicklable results are discarded."""
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return
+        self._spill_bytes(number, data)
+
+    def _spill_bytes(self, number: int, data: bytes) -> None:
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix='symcalc-history-')
+            atexit.register(shutil.rmtree, self._spill_dir, True)
+        path = os.path.join(self._spill_dir, f"out_{number}.pkl")
+        try:
+            with open(path, 'wb') as f:
+                f.write(data)
+        except OSError:
+            self._remove(path)
+            return
+        self._spilled[number] = path
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class HistoryView:
+    """Read-only out[n] accessor placed in the parser's local dict."""
+
+    def __init__(self, history: ResultHistory):
+        self._history = history
+
+    def __getitem__(self, number):
+        return _parser_value(self._history.get(int(number)))
+
+    def __repr__(self):
+        return f"<history of {self._history.count} results>"
+
+
+def _parser_value(value: Any) -> Any:
+    """SI magnitude of quantities; array results as their expression over array names."""
+    from core.arrays import ArrayExpression
+    from core.quantity import SIQuantity
+
+    if isinstance(value, SIQuantity):
+        return value.magnitude
+    if isinstance(value, ArrayExpression):
+        return value.expr
+    return value
+
+
+def history_names(history: ResultHistory) -> Dict[str, Any]:
+    """Parser names for the history: out, and ans if there is a result."""
+    names = {'out': HistoryView(history)}
+    if history.count:
+        try:
+            last = history.last
+        except EnvironmentError:
+            return names
+        names['ans'] = _parser_value(last)
+    return names
@@ -5,11 +5,12 @@ import re
 from decimal import Decimal
 from sympy import (
     parse_expr, sympify, Eq, Lt, Gt, Le, Ge, Ne,
-    Rational
+    Rational, Symbol
 )
 from sympy.parsing.sympy_parser import (
     standard_transformations, implicit_multiplication_application, convert_xor
 )
+from core.history import history_names
 from utils.exceptions import ParseError
 
 class ExpressionParser:
@@ -20,11 +21,19 @@ class ExpressionParser:
         convert_xor,
     )
 
+    PIPE_TOKEN = '_'  # Name bound to the previous stage's result in a pipeline
+    PIPE_PATTERN = re.compile(r'(?<![\w.])_(?!\w)')
+
     def __init__(self, environment):
         self.env = environment
+        self.pipe_value = None
 
-    def parse(self, expression: str):
-        """Parse a mathematical expression or equation."""
+    def parse(self, expression: str, symbols=None):
+        """
+        Parse a mathematical expression or equation.
+        Names in `symbols` stay symbolic even if stored in the environment;
+        a dict maps names to the objects to use instead (e.g. functions).
+        """
         if not expression.strip():
             raise ParseError("Empty expression")
 
@@ -32,45 +41,99 @@ class ExpressionParser:
         inequality_ops = ['<=', '>=', '<', '>', '!=']
         for op in inequality_ops:
             if op in expression and not expression.strip().startswith('Matrix'):
-                return self._parse_inequality(expression, op)
+                return self._parse_inequality(expression, op, symbols)
 
         # Check for equations
         if '=' in expression and not expression.strip().startswith('Matrix'):
-            return self._parse_equation(expression)
+            return self._parse_equation(expression, symbols)
 
         # Regular expression
-        return self._parse_expression(expression)
+        return self._parse_expression(expression, symbols)
+
+    def parse_quantity(self, expression: str):
+        """
+        Parse an expression, carrying the dimensions of unit-valued variables.
+        Returns an SIQuantity when the result has dimensions, otherwise the
+        plain SI-valued expression. Raises DimensionError on unit mismatches.
+        Expressions over array variables become lazy ArrayExpressions.
+        """
+        from core.quantity import SIQuantity, dimension_of
+
+        dimensions = self.env.get_dimensions()
+        if not dimensions:
+            return self._with_arrays(self.parse(expression))
+
+        expr = self.parse(expression, symbols=list(dimensions))
+        symbol_dims = {Symbol(name): dims for name, dims in dimensions.items()}
+        result_dims = dimension_of(expr, symbol_dims)
+
+        magnitudes = {Symbol(name): self.env.get(name).magnitude for name in dimensions}
+        magnitude = expr.xreplace(magnitudes) if hasattr(expr, 'xreplace') else expr
+        quantity = SIQuantity(magnitude, result_dims)
+        if quantity.is_dimensionless or hasattr(expr, 'lhs'):
+            return self._with_arrays(magnitude)
+        return quantity
+
+    def _with_arrays(self, expr):
+        """Wrap an expression that mentions array variables as an ArrayExpression."""
+        from sympy import Expr
+        from core.arrays import ArrayExpression
+
+        arrays = self.env.get_arrays()
+        if not arrays or not isinstance(expr, Expr):
+            return expr
+        used = {Symbol(name): value for name, value in arrays.items() if Symbol(name) in expr.free_symbols}
+        return ArrayExpression(expr, used) if used else expr
+
+    def _local_dict(self, symbols=None) -> dict:
+        """Environment variables for parsing, with `symbols` left symbolic."""
+        local_dict = self.env.get_symbol_dict()
+        # ans / out[n]; stored variables of the same name take precedence
+        for name, value in history_names(self.env.history).items():
+            local_dict.setdefault(name, value)
+        if isinstance(symbols, dict):
+            local_dict.update(symbols)
+        else:
+            for name in symbols or ():
+                local_dict[str(name)] = Symbol(str(name))
+        if self.pipe_value is not None:
+            local_dict[self.PIPE_TOKEN] = self.pipe_value
+        return local_dict
+
+    def references_pipe(self, text: str) -> bool:
+        """True if text uses the pipeline token."""
+        return bool(self.PIPE_PATTERN.search(text))
 
-    def _parse_expression(self, expr_str: str):
+    def _parse_expression(self, expr_str: str, symbols=None):
         """Parse a regular mathematical expression."""
         try:
             return parse_expr(
                 expr_str,
                 transformations=self.TRANSFORMATIONS,
-                local_dict=self.env.get_symbol_dict(),
+                local_dict=self._local_dict(symbols),
                 evaluate=True
             )
         except Exception as e:
             raise ParseError(f"Could not parse expression '{expr_str}': {e}")
 
-    def _parse_equation(self, eq_str: str):
+    def _parse_equation(self, eq_str: str, symbols=None):
         """Parse an equation (contains =)."""
         try:
             left, right = eq_str.split('=', 1)
-            left_expr = self._parse_expression(left.strip())
-            right_expr = self._parse_expression(right.strip())
+            left_expr = self._parse_expression(left.strip(), symbols)
+            right_expr = self._parse_expression(right.strip(), symbols)
             return Eq(left_expr, right_expr)
         except ValueError:
             raise ParseError("Multiple = signs not supported")
         except Exception as e:
             raise ParseError(f"Could not parse equation: {e}")
 
-    def _parse_inequality(self, ineq_str: str, op: str):
+    def _parse_inequality(self, ineq_str: str, op: str, symbols=None):
         """Parse an inequality."""
         try:
             left, right = ineq_str.split(op, 1)
-            left_expr = self._parse_expression(left.strip())
-            right_expr = self._parse_expression(right.strip())
+            left_expr = self._parse_expression(left.strip(), symbols)
+            right_expr = self._parse_expression(right.strip(), symbols)
 
             op_map = {
                 '<': Lt, '>': Gt, '<=': Le,
@@ -0,0 +1,219 @@
+"""
+Sparse polynomial-ring fast paths for expand and factor.
+
+Polynomials with integer or rational coefficients are converted once to a
+PolyElement over ZZ or QQ; all arithmetic then happens on sparse
+dictionaries instead of Expr trees.
+"""
+from sympy import Expr, Mul, Number
+from sympy.core.mul import _keep_coeff
+from sympy.polys.domains import ZZ, QQ
+from sympy.polys.polyutils import _sort_gens
+from sympy.polys.rings import ring
+
+
+def to_polynomial(expr):
+    """
+    Convert expr to a PolyElement over ZZ or QQ in its free symbols.
+    Returns None if expr is not a polynomial with rational coefficients.
+    """
+    if not isinstance(expr, Expr):
+        return None  # Equations, relationals and matrices take the general path
+    gens = expr.free_symbols
+    if not gens or expr.is_Atom or not expr.is_polynomial(*gens):
+        return None
+
+    numbers = expr.atoms(Number)
+    if not all(n.is_Rational for n in numbers):
+        return None  # Floats would change the result's representation
+    domain = ZZ if all(n.is_Integer for n in numbers) else QQ
+
+    # Same generator order as Poly, so factor signs match sympy.factor
+    R = ring(_sort_gens(list(gens)), domain)[0]
+    try:
+        return R.from_expr(expr)
+    except ValueError:
+        return None  # e.g. pi or I as a coefficient
+
+
+def describe_ring(poly) -> str:
+    """Ring name for verbose output, e.g. 'ZZ[x,y]'."""
+    return f"{poly.ring.domain}[{','.join(str(g) for g in poly.ring.symbols)}]"
+
+
+def factor_polynomial(poly):
+    """Irreducible factorization of a PolyElement as a SymPy expression."""
+    coeff, factors = poly.factor_list()
+    domain = poly.ring.domain
+    # _keep_coeff stops 2*(x + 1) distributing to 2*x + 2, as in sympy.factor
+    return _keep_coeff(domain.to_sympy(coeff), Mul(*[f.as_expr() ** k for f, k in factors]))
+
+
+# ----------------------------------------------------------------------
+# Numerical roots
+# ----------------------------------------------------------------------
+ABERTH_MIN_DEGREE = 60       # Below this, companion-matrix eigenvalues are faster
+ABERTH_MAX_ITERATIONS = 100
+ABERTH_BLOCK = 1_000_000     # Max pairwise differences held at once
+
+
+class PolynomialRoots:
+    """Numerical roots with the method used and whether every root converged."""
+
+    def __init__(self, roots, method: str, iterations: int = 0, converged: bool = True):
+        self.roots = roots
+        self.method = method
+        self.iterations = iterations
+        self.converged = converged
+
+
+def numeric_roots(coeffs) -> PolynomialRoots:
+    """
+    All complex roots of the polynomial with coefficients `coeffs` (highest
+    degree first). Low degrees use the eigenvalues of the companion matrix;
+    higher degrees use Aberth-Ehrlich iteration, which is O(n^2) per sweep
+    instead of O(n^3), started from the Newton polygon of the coefficients.
+    Either way the roots get a final Newton polishing step.
+    """
+    import numpy as np
+
+    coeffs = np.trim_zeros(np.asarray(coeffs, dtype=complex), 'f')
+    if not coeffs.size:
+        raise ValueError("The zero polynomial has no isolated roots")
+    nonzero = np.flatnonzero(coeffs)
+    zeros = np.zeros(coeffs.size - 1 - nonzero[-1], dtype=complex)
+    coeffs = coeffs[:nonzero[-1] + 1]
+    degree = coeffs.size - 1
+
+    if degree == 0:
+        return PolynomialRoots(zeros, 'trivial')
+    if degree < ABERTH_MIN_DEGREE:
+        roots = _polish(coeffs, np.roots(coeffs))
+        return PolynomialRoots(np.concatenate([roots, zeros]), 'companion matrix')
+
+    roots, iterations, converged = _aberth(coeffs)
+    roots = _polish(coeffs, roots)
+    return PolynomialRoots(np.concatenate([roots, zeros]), 'Aberth-Ehrlich', iterations, converged)
+
+
+def _newton_ratio(coeffs, z):
+    """
+    Newton corrections p(z)/p'(z), and whether |p(z)| is within rounding
+    error. Points outside the unit disk are evaluated through the reversed
+    polynomial in 1/z so that the powers stay bounded.
+    """
+    import numpy as np
+
+    eps = np.finfo(float).eps
+    degree = coeffs.size - 1
+    ratio = np.empty_like(z)
+    small = np.empty(z.shape, dtype=bool)
+    outside = np.abs(z) > 1
+    for mask, c in ((~outside, coeffs), (outside, coeffs[::-1])):
+        if not mask.any():
+            continue
+        t = z[mask] if c is coeffs else 1 / z[mask]
+        ascending = c[::-1]
+        p = _evaluate(ascending, t)
+        dp = _evaluate(ascending[1:] * np.arange(1, degree + 1), t)
+        bound = _evaluate(np.abs(ascending), np.abs(t))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if c is coeffs:
+                ratio[mask] = p / dp
+            else:
+                # p(z) = z^n q(1/z)  =>  p/p' = z q / (n q - q'/z)
+                ratio[mask] = z[mask] * p / (degree * p - t * dp)
+        small[mask] = np.abs(p) <= 4 * degree * eps * bound
+    return ratio, small
+
+
+def _evaluate(ascending, t):
+    """
+    Polynomial with coefficients a_0..a_n at points |t| <= 1 by baby-step
+    giant-step: blocks of ~sqrt(n) coefficients are evaluated with one
+    matrix product, then combined by Horner's rule in t^block.
+    """
+    import numpy as np
+
+    size = max(1, int(np.sqrt(ascending.size)))
+    blocks = -(-ascending.size // size)
+    padded = np.zeros(blocks * size, dtype=ascending.dtype)
+    padded[:ascending.size] = ascending
+    powers = t[:, None] ** np.arange(size)
+    values = powers @ padded.reshape(blocks, size).T
+    step = t ** size
+    result = values[:, -1]
+    for j in range(blocks - 2, -1, -1):
+        result = result * step + values[:, j]
+    return result
+
+
+def _initial_guesses(coeffs):
+    """Points on circles whose radii come from the upper hull of (k, log|a_k|)."""
+    import numpy as np
+
+    degree = coeffs.size - 1
+    magnitudes = np.abs(coeffs[::-1])  # a_0 .. a_n
+    ks = np.flatnonzero(magnitudes)
+    logs = np.log(magnitudes[ks])
+    hull = []
+    for k, y in zip(ks, logs):
+        while len(hull) >= 2:
+            (k1, y1), (k2, y2) = hull[-2], hull[-1]
+            if (y2 - y1) * (k - k1) <= (y - y1) * (k2 - k1):
+                hull.pop()
+            else:
+                break
+        hull.append((k, y))
+
+    guesses = []
+    for i, ((k1, y1), (k2, y2)) in enumerate(zip(hull, hull[1:])):
+        m = k2 - k1
+        radius = np.exp((y1 - y2) / m)
+        angles = 2 * np.pi * np.arange(m) / m + 2 * np.pi * i / degree + 0.4
+        guesses.append(radius * np.exp(1j * angles))
+    return np.concatenate(guesses)
+
+
+def _aberth(coeffs):
+    """Simultaneous Aberth-Ehrlich iteration; converged roots are frozen."""
+    import numpy as np
+
+    z = _initial_guesses(coeffs)
+    n = z.size
+    active = np.ones(n, dtype=bool)
+    block = max(1, ABERTH_BLOCK // n)
+    iterations = 0
+    while active.any() and iterations < ABERTH_MAX_ITERATIONS:
+        iterations += 1
+        index = np.flatnonzero(active)
+        ratio, small = _newton_ratio(coeffs, z[index])
+        corrections = np.empty_like(ratio)
+        for start in range(0, index.size, block):
+            rows = index[start:start + block]
+            diff = z[rows, None] - z[None, :]
+            diff[np.arange(rows.size), rows] = np.inf  # exclude j == i
+            s = (1 / diff).sum(axis=1)
+            r = ratio[start:start + block]
+            with np.errstate(invalid='ignore', over='ignore'):
+                corrections[start:start + block] = r / (1 - r * s)
+        corrections[small] = 0
+        bad = ~np.isfinite(corrections)
+        corrections[bad] = 0
+        z[index] -= corrections
+        done = small | (np.abs(corrections) <= 4 * np.finfo(float).eps * np.abs(z[index]))
+        active[index[done & ~bad]] = False
+    return z, iterations, not active.any()
+
+
+def _polish(coeffs, z):
+    """One Newton step per root, kept only where it shrinks the correction."""
+    import numpy as np
+
+    if not z.size:
+        return z
+    ratio, _ = _newton_ratio(coeffs, z)
+    candidate = z - ratio
+    new_ratio, _ = _newton_ratio(coeffs, candidate)
+    better = np.isfinite(candidate) & (np.abs(new_ratio) < np.abs(ratio))
+    return np.where(better, candidate, z)
@@ -0,0 +1,160 @@
+"""
+Unit-valued variables resolved once to an SI magnitude and dimension vector.
+
+Dimensions are tuples of exponents over the SI base dimensions, so
+dimensional analysis of an expression is just vector addition/scaling.
+"""
+from typing import Any, Dict, Tuple
+from sympy import Rational, Symbol, sympify, Add, Mul, Pow, Abs, Min, Max
+from sympy.core.function import AppliedUndef
+from sympy.core.relational import Relational
+from utils.exceptions import DimensionError
+
+BASE_DIMENSIONS = ('[length]', '[mass]', '[time]', '[current]',
+                   '[temperature]', '[substance]', '[luminosity]')
+BASE_UNITS = ('m', 'kg', 's', 'A', 'K', 'mol', 'cd')
+DIMENSIONLESS = (Rational(0),) * len(BASE_DIMENSIONS)
+
+# Named SI units preferred when displaying results of these dimensions
+PREFERRED_UNITS = {
+    (1, 1, -2, 0, 0, 0, 0): 'N',
+    (2, 1, -2, 0, 0, 0, 0): 'J',
+    (2, 1, -3, 0, 0, 0, 0): 'W',
+    (-1, 1, -2, 0, 0, 0, 0): 'Pa',
+    (0, 0, -1, 0, 0, 0, 0): 'Hz',
+    (0, 0, 1, 1, 0, 0, 0): 'C',
+    (2, 1, -3, -1, 0, 0, 0): 'V',
+    (2, 1, -3, -2, 0, 0, 0): 'ohm',
+    (-2, -1, 4, 2, 0, 0, 0): 'F',
+    (2, 1, -2, -1, 0, 0, 0): 'Wb',
+    (0, 1, -2, -1, 0, 0, 0): 'T',
+    (2, 1, -2, -2, 0, 0, 0): 'H',
+}
+
+Dimensions = Tuple[Rational, ...]
+
+
+class SIQuantity:
+    """A magnitude in SI base units together with its dimension vector."""
+
+    __slots__ = ('magnitude', 'dimensions', 'original')
+
+    def __init__(self, magnitude: Any, dimensions: Dimensions, original: str = None):
+        self.magnitude = sympify(magnitude)
+        self.dimensions = tuple(Rational(d) for d in dimensions)
+        self.original = original
+
+    @classmethod
+    def from_pint(cls, quantity) -> 'SIQuantity':
+        """Resolve a pint quantity to SI once; no pint calls are needed afterwards."""
+        dimensionality = dict(quantity.dimensionality)
+        unsupported = [d for d in dimensionality if d not in BASE_DIMENSIONS]
+        if unsupported:
+            raise DimensionError(f"Unsupported dimension(s): {', '.join(unsupported)}")
+
+        vector = tuple(Rational(str(dimensionality.get(d, 0))) for d in BASE_DIMENSIONS)
+        return cls(quantity.to_base_units().magnitude, vector, str(quantity))
+
+    @property
+    def is_dimensionless(self) -> bool:
+        return self.dimensions == DIMENSIONLESS
+
+    def unit_string(self) -> str:
+        """Preferred unit for the dimensions, else a product of SI base units."""
+        key = tuple(int(d) if d.is_integer else d for d in self.dimensions)
+        if key in PREFERRED_UNITS:
+            return PREFERRED_UNITS[key]
+        return format_dimensions(self.dimensions)
+
+    def __str__(self):
+        return f"{self.magnitude} {self.unit_string()}"
+
+    def __repr__(self):
+        return f"SIQuantity({self.magnitude!r}, {self.dimensions!r})"
+
+
+def format_dimensions(dimensions: Dimensions) -> str:
+    """Render a dimension vector as SI base units, e.g. 'm*kg/s**2'."""
+    numerator, denominator = [], []
+    for unit, exponent in zip(BASE_UNITS, dimensions):
+        if exponent == 0:
+            continue
+        target = numerator if exponent > 0 else denominator
+        power = abs(exponent)
+        if power == 1:
+            target.append(unit)
+        else:
+            target.append(f"{unit}**{power}" if power.is_Integer else f"{unit}**({power})")
+    text = '*'.join(numerator) or '1'
+    if denominator:
+        text += '/' + ('*'.join(denominator) if len(denominator) == 1 else f"({'*'.join(denominator)})")
+    return text if numerator or denominator else 'dimensionless'
+
+
+def describe_dimensions(dimensions: Dimensions) -> str:
+    """Human-readable dimension vector for error messages."""
+    if dimensions == DIMENSIONLESS:
+        return 'dimensionless'
+    return format_dimensions(dimensions)
+
+
+def dimension_of(expr: Any, dimensions: Dict[Symbol, Dimensions]) -> Dimensions:
+    """
+    Dimensions of expr given the dimensions of its unit-valued symbols.
+    Raises DimensionError for inconsistent sums or dimensional function arguments.
+    """
+    if getattr(expr, 'is_Symbol', False) and expr in dimensions:
+        return dimensions[expr]
+    if not getattr(expr, 'args', None) or expr.is_Number or expr.is_Symbol or expr.is_Matrix:
+        return DIMENSIONLESS
+
+    if isinstance(expr, Mul):
+        total = DIMENSIONLESS
+        for factor in expr.args:
+            total = _add(total, dimension_of(factor, dimensions))
+        return total
+
+    if isinstance(expr, Pow):
+        base = dimension_of(expr.base, dimensions)
+        exponent = expr.exp
+        if dimension_of(exponent, dimensions) != DIMENSIONLESS:
+            raise DimensionError("Exponent must be dimensionless")
+        if base == DIMENSIONLESS:
+            return DIMENSIONLESS
+        if not exponent.is_Rational:
+            raise DimensionError(f"Cannot raise {describe_dimensions(base)} to symbolic power {exponent}")
+        return tuple(d * exponent for d in base)
+
+    if isinstance(expr, (Add, Min, Max, Relational)):
+        terms = [dimension_of(arg, dimensions) for arg in expr.args]
+        first = terms[0]
+        for other in terms[1:]:
+            if other != first:
+                raise DimensionError(
+                    f"Incompatible dimensions: {describe_dimensions(first)} and {describe_dimensions(other)}"
+                )
+        return first
+
+    if isinstance(expr, Abs):
+        return dimension_of(expr.args[0], dimensions)
+
+    if isinstance(expr, AppliedUndef):
+        return DIMENSIONLESS  # Unknown function: nothing to check
+
+    if expr.is_Derivative:
+        result = dimension_of(expr.expr, dimensions)
+        for var, count in expr.variable_count:
+            result = _add(result, tuple(-d * count for d in dimension_of(var, dimensions)))
+        return result
+
+    if expr.is_Function:
+        for arg in expr.args:
+            if dimension_of(arg, dimensions) != DIMENSIONLESS:
+                raise DimensionError(f"Argument of {expr.func.__name__} must be dimensionless")
+        return DIMENSIONLESS
+
+    return DIMENSIONLESS
+
+
+def _add(a: Dimensions, b: Dimensions) -> Dimensions:
+    return tuple(x + y for x, y in zip(a, b))
@@ -0,0 +1,325 @@
+"""
+Lazily extended truncated Taylor series.
+
+Coefficients are computed with Taylor-mode recurrences over a polys domain
+(QQ when every coefficient is rational, EX otherwise), so each term costs
+one convolution instead of a symbolic derivative, and a series that has
+been computed to order n can be extended without recomputing earlier terms.
+"""
+from typing import Dict, List
+from sympy import (
+    Add, Mul, Pow, Order, Rational, exp, log, sin, cos, sinh, cosh, tan, tanh,
+    atan, asin, acos, asinh, atanh, sympify
+)
+from sympy.polys.domains import QQ, EX
+from sympy.polys.polyerrors import CoercionFailed
+
+
+# Derivatives of inverse functions, expanded by integrating f' * g'(f)
+INVERSE_DERIVATIVES = {
+    atan: lambda u: 1 / (1 + u**2),
+    asin: lambda u: (1 - u**2) ** Rational(-1, 2),
+    acos: lambda u: -(1 - u**2) ** Rational(-1, 2),
+    asinh: lambda u: (1 + u**2) ** Rational(-1, 2),
+    atanh: lambda u: 1 / (1 - u**2),
+}
+
+
+class NotTaylorError(Exception):
+    """The expansion is not a Taylor series (pole, branch point) or is unsupported."""
+    pass
+
+
+class _NeedsEX(Exception):
+    """Internal: a coefficient is not rational, rebuild over EX."""
+    pass
+
+
+class _Node:
+    """A series term whose coefficients are computed on demand and cached."""
+
+    def __init__(self, K):
+        self.K = K
+        self.coeffs: List = []
+
+    def coeff(self, k: int):
+        while len(self.coeffs) <= k:
+            self.coeffs.append(self._next(len(self.coeffs)))
+        return self.coeffs[k]
+
+    def _next(self, k: int):
+        raise NotImplementedError
+
+
+class _Constant(_Node):
+    def __init__(self, K, value):
+        super().__init__(K)
+        self.value = value
+
+    def _next(self, k):
+        return self.value if k == 0 else self.K.zero
+
+
+class _Variable(_Node):
+    """x expanded about x0: x0 + t."""
+
+    def __init__(self, K, x0):
+        super().__init__(K)
+        self.x0 = x0
+
+    def _next(self, k):
+        return self.x0 if k == 0 else (self.K.one if k == 1 else self.K.zero)
+
+
+class _Sum(_Node):
+    def __init__(self, K, terms):
+        super().__init__(K)
+        self.terms = terms
+
+    def _next(self, k):
+        total = self.K.zero
+        for term in self.terms:
+            total += term.coeff(k)
+        return total
+
+
+class _Product(_Node):
+    def __init__(self, K, a, b):
+        super().__init__(K)
+        self.a, self.b = a, b
+
+    def _next(self, k):
+        total = self.K.zero
+        for i in range(k + 1):
+            total += self.a.coeff(i) * self.b.coeff(k - i)
+        return total
+
+
+class _Derivative(_Node):
+    """d/dt of a series."""
+
+    def __init__(self, K, f):
+        super().__init__(K)
+        self.f = f
+
+    def _next(self, k):
+        return self.K.convert(k + 1) * self.f.coeff(k + 1)
+
+
+class _Antiderivative(_Node):
+    """Series with constant term c0 whose derivative is `derivative`."""
+
+    def __init__(self, K, c0, derivative):
+        super().__init__(K)
+        self.c0, self.derivative = c0, derivative
+
+    def _next(self, k):
+        if k == 0:
+            return self.c0
+        return self.derivative.coeff(k - 1) / self.K.convert(k)
+
+
+class _Power(_Node):
+    """f**alpha for constant alpha, requiring f(x0) != 0."""
+
+    def __init__(self, K, f, alpha, g0):
+        super().__init__(K)
+        self.f, self.alpha, self.g0 = f, alpha, g0
+
+    def _next(self, k):
+        if k == 0:
+            return self.g0
+        K, f = self.K, self.f
+        total = K.zero
+        for j in range(1, k + 1):
+            total += ((self.alpha + K.one) * K.convert(j) - K.convert(k)) * f.coeff(j) * self.coeff(k - j)
+        return total / (K.convert(k) * f.coeff(0))
+
+
+class _Exp(_Node):
+    def __init__(self, K, f, g0):
+        super().__init__(K)
+        self.f, self.g0 = f, g0
+
+    def _next(self, k):
+        if k == 0:
+            return self.g0
+        K = self.K
+        total = K.zero
+        for j in range(1, k + 1):
+            total += K.convert(j) * self.f.coeff(j) * self.coeff(k - j)
+        return total / K.convert(k)
+
+
+class _Log(_Node):
+    def __init__(self, K, f, g0):
+        super().__init__(K)
+        self.f, self.g0 = f, g0
+
+    def _next(self, k):
+        if k == 0:
+            return self.g0
+        K = self.K
+        total = K.zero
+        for j in range(1, k):
+            total += K.convert(j) * self.coeff(j) * self.f.coeff(k - j)
+        return (self.f.coeff(k) - total / K.convert(k)) / self.f.coeff(0)
+
+
+class _SinCos:
+    """Coupled sine/cosine (or sinh/cosh) recurrences of the same argument."""
+
+    def __init__(self, K, f, s0, c0, hyperbolic):
+        self.sin = _Coupled(K, f, s0, self, 'sin')
+        self.cos = _Coupled(K, f, c0, self, 'cos')
+        self.sign = K.one if hyperbolic else -K.one
+
+
+class _Coupled(_Node):
+    def __init__(self, K, f, g0, pair, kind):
+        super().__init__(K)
+        self.f, self.g0, self.pair, self.kind = f, g0, pair, kind
+
+    def _next(self, k):
+        if k == 0:
+            return self.g0
+        K = self.K
+        other = self.pair.cos if self.kind == 'sin' else self.pair.sin
+        total = K.zero
+        for j in range(1, k + 1):
+            total += K.convert(j) * self.f.coeff(j) * other.coeff(k - j)
+        total = total / K.convert(k)
+        return total if self.kind == 'sin' else self.pair.sign * total
+
+
+class TaylorSeries:
+    """Taylor expansion of expr in x about x0 whose order can be raised incrementally."""
+
+    def __init__(self, expr, x, x0):
+        self.expr = sympify(expr)
+        self.x = x
+        self.x0 = sympify(x0)
+        try:
+            self._root = self._build(QQ)
+            self._root.coeff(0)
+        except (CoercionFailed, _NeedsEX):
+            self._root = self._build(EX)
+
+    @property
+    def order(self) -> int:
+        """Number of coefficients computed so far."""
+        return len(self._root.coeffs)
+
+    def coefficients(self, n: int) -> List:
+        """First n Taylor coefficients as SymPy expressions."""
+        K = self._root.K
+        return [K.to_sympy(self._root.coeff(k)) for k in range(n)]
+
+    def as_expr(self, n: int):
+        """Truncated series sum_{k<n} c_k (x - x0)^k + O((x - x0)^n)."""
+        t = self.x - self.x0
+        # evaluate=False stops c*(x - x0) being distributed into c*x - c*x0
+        terms = [Mul(c, t**k, evaluate=False) if k == 1 else c * t**k
+                 for k, c in enumerate(self.coefficients(n)) if c != 0]
+        point = (self.x, self.x0) if self.x0 != 0 else self.x
+        return Add(*terms) + Order(t**n, point)
+
+    # ------------------------------------------------------------------
+    # Expression tree -> series nodes
+    # ------------------------------------------------------------------
+    def _build(self, K) -> _Node:
+        self._K = K
+        self._memo: Dict = {}
+        self._pairs: Dict = {}
+        return self._node(self.expr)
+
+    def _to_domain(self, value):
+        K = self._K
+        value = sympify(value)
+        if K == QQ and not value.is_Rational:
+            raise _NeedsEX()
+        return K.from_sympy(value)
+
+    def _value_at_point(self, node: _Node):
+        return self._K.to_sympy(node.coeff(0))
+
+    def _node(self, expr) -> _Node:
+        if expr in self._memo:
+            return self._memo[expr]
+        node = self._make(expr)
+        self._memo[expr] = node
+        return node
+
+    def _make(self, expr) -> _Node:
+        K, x = self._K, self.x
+
+        if not expr.has(x):
+            return _Constant(K, self._to_domain(expr))
+        if expr == x:
+            return _Variable(K, self._to_domain(self.x0))
+
+        if isinstance(expr, Add):
+            return _Sum(K, [self._node(a) for a in expr.args])
+
+        if isinstance(expr, Mul):
+            factors = [self._node(a) for a in expr.args]
+            node = factors[0]
+            for factor in factors[1:]:
+                node = _Product(K, node, factor)
+            return node
+
+        if isinstance(expr, Pow):
+            return self._power(expr.base, expr.exp)
+
+        f = self._node(expr.args[0]) if expr.args else None
+        f0 = self._value_at_point(f) if f is not None else None
+
+        if isinstance(expr, exp):
+            return _Exp(K, f, self._to_domain(exp(f0)))
+        if isinstance(expr, log):
+            if f0 == 0:
+                raise NotTaylorError("log has a singularity at the expansion point")
+            return _Log(K, f, self._to_domain(log(f0)))
+        if isinstance(expr, (sin, cos, sinh, cosh)):
+            hyperbolic = isinstance(expr, (sinh, cosh))
+            key = (expr.args[0], hyperbolic)
+            if key not in self._pairs:
+                s0, c0 = (sinh(f0), cosh(f0)) if hyperbolic else (sin(f0), cos(f0))
+                self._pairs[key] = _SinCos(K, f, self._to_domain(s0), self._to_domain(c0), hyperbolic)
+            pair = self._pairs[key]
+            return pair.sin if isinstance(expr, (sin, sinh)) else pair.cos
+        if isinstance(expr, tan):
+            return self._node(sin(expr.args[0]) / cos(expr.args[0]))
+        if isinstance(expr, tanh):
+            return self._node(sinh(expr.args[0]) / cosh(expr.args[0]))
+
+        if isinstance(expr, tuple(INVERSE_DERIVATIVES)):
+            # g = g(x0) + integral of f' * g'(f)
+            outer = INVERSE_DERIVATIVES[expr.func](expr.args[0])
+            inner = _Product(K, _Derivative(K, f), self._node(outer))
+            return _Antiderivative(K, self._to_domain(expr.func(f0)), inner)
+
+        raise NotTaylorError(f"No series recurrence for {type(expr).__name__}")
+
+    def _power(self, base, exponent) -> _Node:
+        K = self._K
+        if exponent.has(self.x):
+            return self._node(exp(exponent * log(base)))
+
+        f = self._node(base)
+        f0 = self._value_at_point(f)
+        if f0 != 0:
+            alpha = self._to_domain(exponent)
+            return _Power(K, f, alpha, self._to_domain(f0 ** exponent))
+
+        if exponent.is_Integer and exponent > 0:
+            # Zero constant term: binary powering keeps it a Taylor series
+            result, square, n = None, f, int(exponent)
+            while n:
+                if n & 1:
+                    result = square if result is None else _Product(K, result, square)
+                n >>= 1
+                if n:
+                    square = _Product(K, square, square)
+            return result
+        raise NotTaylorError("Expansion point is a pole or branch point")
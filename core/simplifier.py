@@ -0,0 +1,127 @@
+"""
+Budgeted simplification: a pipeline of targeted strategies, cheapest first.
+
+Each strategy is applied to the best expression found so far and kept only
+if it lowers the complexity measure. Passes repeat until a pass makes no
+improvement or the time budget runs out.
+"""
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from sympy import (
+    cancel, together, factor, apart, trigsimp, powsimp, powdenest,
+    logcombine, expand_log, radsimp, gammasimp, combsimp, simplify,
+    count_ops, preorder_traversal, gamma, factorial, binomial
+)
+from core.polynomial import to_polynomial, factor_polynomial
+
+MEASURES: Dict[str, Callable[[Any], int]] = {
+    'ops': count_ops,
+    'length': lambda expr: len(str(expr)),
+    'nodes': lambda expr: sum(1 for _ in preorder_traversal(expr)),
+}
+
+
+def _factor(expr):
+    poly = to_polynomial(expr)
+    return factor_polynomial(poly) if poly is not None else factor(expr)
+
+
+def _apart(expr):
+    symbols = expr.free_symbols
+    if len(symbols) != 1:
+        return expr  # apart needs a single variable
+    return apart(expr, next(iter(symbols)))
+
+
+def _gammasimp(expr):
+    return gammasimp(expr) if expr.has(gamma, factorial, binomial) else expr
+
+
+def _combsimp(expr):
+    return combsimp(expr) if expr.has(factorial, binomial) else expr
+
+
+# (name, function) in the order tried: cheap, rational, trig, power, log, gamma
+STRATEGIES: List[Tuple[str, Callable]] = [
+    ('cancel', cancel),
+    ('together', together),
+    ('factor', _factor),
+    ('apart', _apart),
+    ('trigsimp', trigsimp),
+    ('powsimp', powsimp),
+    ('powdenest', powdenest),
+    ('logcombine', logcombine),
+    ('expand_log', expand_log),
+    ('radsimp', radsimp),
+    ('gammasimp', _gammasimp),
+    ('combsimp', _combsimp),
+]
+
+FULL_STRATEGY = ('simplify', simplify)
+
+
+class SimplifyResult:
+    """Outcome of a budgeted simplification."""
+
+    def __init__(self, expr, steps: List[str], before: int, after: int,
+                 elapsed: float, exhausted: bool):
+        self.expr = expr
+        self.steps = steps
+        self.before = before
+        self.after = after
+        self.elapsed = elapsed
+        self.exhausted = exhausted
+
+
+def budgeted_simplify(expr, budget: float = 2.0, measure: str = 'ops',
+                      full: bool = False) -> SimplifyResult:
+    """
+    Simplify expr within roughly `budget` seconds under the named measure.
+    A strategy already running is not interrupted, so the budget is checked
+    between strategies. With full=True SymPy's simplify is tried last,
+    regardless of the budget.
+    """
+    if measure not in MEASURES:
+        raise ValueError(f"Unknown measure '{measure}' (choose from {', '.join(MEASURES)})")
+    score = MEASURES[measure]
+
+    start = time.perf_counter()
+    best, best_score = expr, score(expr)
+    initial = best_score
+    steps: List[str] = []
+    exhausted = False
+
+    improved = True
+    while improved and not exhausted:
+        improved = False
+        for name, strategy in STRATEGIES:
+            if time.perf_counter() - start >= budget:
+                exhausted = True
+                break
+            candidate = _try(strategy, best)
+            if candidate is None or candidate == best:
+                continue
+            candidate_score = score(candidate)
+            if candidate_score < best_score:
+                best, best_score = candidate, candidate_score
+                steps.append(name)
+                improved = True
+
+    # SymPy's simplify cannot be interrupted, so it only runs when asked for
+    if full:
+        name, strategy = FULL_STRATEGY
+        candidate = _try(strategy, best)
+        if candidate is not None and score(candidate) < best_score:
+            best, best_score = candidate, score(candidate)
+            steps.append(name)
+
+    return SimplifyResult(best, steps, initial, best_score,
+                          time.perf_counter() - start, exhausted)
+
+
+def _try(strategy: Callable, expr) -> Optional[Any]:
+    """Apply a strategy, treating failures as 'no candidate'."""
+    try:
+        return strategy(expr)
+    except Exception:
+        return None
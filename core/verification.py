@@ -0,0 +1,158 @@
+"""
+Numeric verification of solve results.
+
+Residuals of all equations are lambdified once and evaluated for every
+solution branch in a single vectorized call. Only residuals that are
+neither clearly zero nor clearly nonzero are escalated to high-precision
+and then symbolic checks.
+"""
+import random
+from typing import Any, Dict, List, Sequence
+from sympy import Abs, Add, Eq, Rational, Symbol, N, lambdify, sympify
+from sympy.core.relational import Relational
+
+TOLERANCE = 1e-10          # Relative residual accepted as zero in double precision
+FAILURE_THRESHOLD = 1e-6   # Relative residual rejected without escalation
+HIGH_PRECISION_DPS = 50
+
+VERIFIED, FAILED, UNKNOWN = 'verified', 'failed', 'unknown'
+
+
+class Check:
+    """Outcome of checking one equation against one solution branch."""
+
+    def __init__(self, status: str, residual: Any = None, method: str = 'numeric'):
+        self.status = status
+        self.residual = residual
+        self.method = method
+
+
+def residual_of(equation):
+    """lhs - rhs for equations; the expression itself for 'expr = 0' input."""
+    if isinstance(equation, Eq):
+        return equation.lhs - equation.rhs
+    if isinstance(equation, Relational):
+        return None  # Inequalities have no residual to check
+    return sympify(equation)
+
+
+def normalize_solutions(solutions, variables: Sequence[Symbol]) -> List[Dict[Symbol, Any]]:
+    """
+    Turn any solve() output (dict, list of dicts, list of tuples, list of
+    values) into a list of {symbol: value} branches. Unrecognised shapes
+    give an empty list.
+    """
+    if isinstance(solutions, dict):
+        return [solutions] if solutions else []
+    if not isinstance(solutions, (list, tuple)):
+        return []
+
+    branches = []
+    for solution in solutions:
+        if isinstance(solution, dict):
+            branches.append(solution)
+        elif isinstance(solution, (tuple, list)) and len(solution) == len(variables):
+            branches.append(dict(zip(variables, solution)))
+        elif len(variables) == 1 and not isinstance(solution, (Relational, tuple, list)):
+            branches.append({variables[0]: solution})
+        else:
+            return []
+    return branches
+
+
+def verify_solutions(equations: Sequence, branches: List[Dict[Symbol, Any]]) -> List[List[Check]]:
+    """
+    Check every equation against every solution branch.
+    Returns checks[branch][equation]. Free parameters (symbols not solved
+    for) are given fixed sample values, so such checks are probabilistic.
+    """
+    import numpy as np
+
+    residuals = [residual_of(eq) for eq in equations]
+    checkable = [i for i, r in enumerate(residuals) if r is not None]
+    checks = [[Check(UNKNOWN, method='none') for _ in equations] for _ in branches]
+    if not branches or not checkable:
+        return checks
+
+    # Every symbol appearing in residuals or solution values
+    symbols = set()
+    for i in checkable:
+        symbols |= residuals[i].free_symbols
+    for branch in branches:
+        symbols |= set(branch)
+        for value in branch.values():
+            symbols |= getattr(value, 'free_symbols', set())
+    symbols = sorted(symbols, key=str)
+    samples = _sample_values(symbols)
+
+    # Each symbol's value in each branch: its solution, else the sample value
+    columns = []
+    for sym in symbols:
+        column = []
+        for branch in branches:
+            value = branch.get(sym, samples[sym])
+            column.append(_complex_value(sympify(value), samples))
+        columns.append(np.array(column, dtype=complex))
+
+    scales = [Add(*[Abs(term) for term in Add.make_args(residuals[i])]) for i in checkable]
+    try:
+        with np.errstate(all='ignore'):
+            func = lambdify(symbols, [residuals[i] for i in checkable] + scales, 'numpy')
+            values = [np.broadcast_to(np.asarray(v, dtype=complex), (len(branches),))
+                      for v in func(*columns)]
+    except Exception:
+        # Functions NumPy has no counterpart for (LambertW, erf, ...)
+        for i in checkable:
+            for b, branch in enumerate(branches):
+                checks[b][i] = _escalate(residuals[i], branch, samples)
+        return checks
+    residual_values, scale_values = values[:len(checkable)], values[len(checkable):]
+
+    for k, i in enumerate(checkable):
+        for b, branch in enumerate(branches):
+            r = residual_values[k][b]
+            scale = max(1.0, abs(scale_values[k][b])) if np.isfinite(scale_values[k][b]) else 1.0
+            if np.isfinite(r) and abs(r) <= TOLERANCE * scale:
+                checks[b][i] = Check(VERIFIED, r)
+            elif np.isfinite(r) and abs(r) > FAILURE_THRESHOLD * scale:
+                checks[b][i] = Check(FAILED, r)
+            else:
+                checks[b][i] = _escalate(residuals[i], branch, samples)
+    return checks
+
+
+def _sample_values(symbols: Sequence[Symbol]) -> Dict[Symbol, Rational]:
+    """Deterministic, non-special rational values for free parameters."""
+    rng = random.Random(0)
+    return {sym: Rational(rng.randint(1000, 9999), 7919) for sym in symbols}
+
+
+def _complex_value(value, samples) -> complex:
+    try:
+        return complex(N(value.subs(samples)))
+    except (TypeError, ValueError):
+        return complex('nan')
+
+
+def _escalate(residual, branch: Dict[Symbol, Any], samples) -> Check:
+    """High-precision, then symbolic, check of a borderline residual."""
+    exact = residual.subs(branch)
+    try:
+        value = N(exact.subs(samples), HIGH_PRECISION_DPS)
+        magnitude = abs(complex(value))
+        if magnitude < 10 ** -(HIGH_PRECISION_DPS - 10):
+            return Check(VERIFIED, value, 'high precision')
+        if magnitude > FAILURE_THRESHOLD:
+            return Check(FAILED, value, 'high precision')
+    except (TypeError, ValueError):
+        pass
+
+    try:
+        is_zero = exact.equals(0)
+    except Exception:
+        is_zero = None
+    if is_zero is True:
+        return Check(VERIFIED, 0, 'symbolic')
+    if is_zero is False:
+        return Check(FAILED, exact, 'symbolic')
+    return Check(UNKNOWN, exact, 'symbolic')
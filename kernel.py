@@ -0,0 +1,45 @@
+"""
+Generated by SymCalc codegen.
+
+    kernel(f, x) = f*x
+"""
+import numpy
+
+
+def kernel(f, x):
+    """Vectorized evaluation; arguments broadcast like NumPy arrays."""
+    return f*x
+
+
+_call = kernel
+
+_CHECK_INPUTS = [[1.7277382401688341, 0.9860002664539788, 1.1447307623950649, 1.621647530810852, 1.0840446697666226, 1.8391975490918366, 0.7432162276994817, 1.3321457441818303], [1.5764202051455294, 0.7031043130126858, 0.958634740538225, 0.780797270638123, 1.2709185690463045, 1.133201997680433, 1.5726573572751419, 0.6883860973842709]]
+_CHECK_EXPECTED = [[2.7236414710047296, 0.69326103997545, 1.0973786773947174, 1.2661779659941648, 1.3777325004820697, 2.0841823367598256, 1.168824468537867, 0.9170306099843955]]
+
+
+def _self_check(rtol=1e-09):
+    """
+    Compare against SymPy reference values; returns the max relative error,
+    or None if no valid real sample points were found (nothing was checked).
+    """
+    if not _CHECK_EXPECTED[0]:
+        return None
+    arrays = [numpy.array(v, dtype=float) for v in _CHECK_INPUTS]
+    results = [_call(*arrays)]
+    worst = 0.0
+    for got, want in zip(results, _CHECK_EXPECTED):
+        want = numpy.array(want)
+        got = numpy.broadcast_to(numpy.asarray(got, dtype=float), want.shape)
+        error = numpy.max(numpy.abs(got - want) / numpy.maximum(numpy.abs(want), 1.0))
+        worst = max(worst, float(error))
+    if worst > rtol:
+        raise AssertionError(f"max relative error {worst:.3e} exceeds {rtol:.1e}")
+    return worst
+
+
+if __name__ == '__main__':
+    _error = _self_check()
+    if _error is None:
+        print("Self-check skipped (no valid sample points)")
+    else:
+        print(f"Self-check passed (max relative error {_error:.2e})")
@@ -3,6 +3,8 @@
 SymCalc - Main entry point and REPL
 """
 import sys
+import time
+import argparse
 from pathlib import Path
 
 # Ensure package modules are importable (project root)
@@ -22,9 +24,10 @@ class SymCalc:
     def __init__(self):
         self.env = Environment()
         self.parser = ExpressionParser(self.env)
-        self.formatter = OutputFormatter()
+        self.formatter = OutputFormatter(history=self.env.history)
         self.validator = InputValidator()
         self.commands = CommandRegistry(self.env, self.parser, self.formatter)
+        self.last_error = None
 
         # Setup SymPy pretty printing
         from sympy import init_printing
@@ -42,14 +45,32 @@ Features:
 - Unit conversions with 'convert'
 - Equation solving with 'solve', 'solve_system'
 - Statistical functions: mean, stdev, etc.
+- Previous results as ans and out[n] ('history' lists them)
+- Pipelines passing results between commands: diff x^3*sin(x), x | simplify | integrate x
 - Both exact and decimal results shown automatically
         """)
 
+    def _is_pipeline(self, stages) -> bool:
+        """
+        '|' separates stages only if the line starts with a command or uses
+        the pipe token, and every later stage is a command or uses the token.
+        """
+        def is_command(stage):
+            words = stage.split(None, 1)
+            return bool(words) and self.commands.has_command(words[0].lower())
+
+        uses_pipe = [self.parser.references_pipe(stage) for stage in stages]
+        if not (is_command(stages[0]) or any(uses_pipe)):
+            return False
+        return all(is_command(stage) or uses for stage, uses in zip(stages[1:], uses_pipe[1:]))
+
     def process_command(self, raw_input: str) -> bool:
         """
         Process a single command input.
         Returns True to continue REPL, False to exit.
+        Errors are reported and recorded in self.last_error.
         """
+        self.last_error = None
         try:
             # Validate and clean input
             cleaned_input = self.validator.clean_input(raw_input)
@@ -60,6 +81,13 @@ Features:
             if cleaned_input.lower() in ('exit', 'quit', 'q'):
                 return False
 
+            # Pipelines: stage | stage | ...; otherwise '|' is SymPy's Or (x | y)
+            if '|' in cleaned_input:
+                stages = self.validator.split_arguments(cleaned_input, '|')
+                if len(stages) > 1 and self._is_pipeline(stages):
+                    self.commands.execute_pipeline(stages)
+                    return True
+
             # Parse command and arguments
             parts = cleaned_input.split(None, 1)
             command = parts[0].lower()
@@ -75,8 +103,10 @@ Features:
         except KeyboardInterrupt:
             return False
         except SymCalcError as e:
+            self.last_error = e
             print(f"Error: {e}")
         except Exception as e:
+            self.last_error = e
             print(f"Unexpected error: {e}")
             if "--debug" in sys.argv:
                 import traceback
@@ -87,9 +117,10 @@ Features:
     def _evaluate_expression(self, expression: str):
         """Evaluate a mathematical expression."""
         try:
-            result = self.parser.parse(expression)
+            result = self.parser.parse_quantity(expression)
             self.formatter.display_result(result, label="Result")
         except Exception as e:
+            self.last_error = e
             print(f"Expression evaluation error: {e}")
 
     def run_repl(self):
@@ -106,28 +137,78 @@ Features:
 
         print("\nGoodbye!")
 
-    def run_file(self, filename: str):
-        """Execute commands from a file."""
+    def run_file(self, filename: str, checkpoint_dir: str = None, resume: bool = False,
+                 checkpoint_interval: float = 60.0):
+        """
+        Execute commands from a file. With checkpoint_dir, the environment
+        and current line are snapshotted every checkpoint_interval seconds
+        and each line's duration is written to a run log; resume restarts
+        after the last checkpointed line of the same (unchanged) script.
+        """
+        checkpoints = None
         try:
             with open(filename, 'r') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        print(f"[{line_num}] {line}")
-                        if not self.process_command(line):
-                            break
+                lines = f.readlines()
+
+            start_after = 0
+            if checkpoint_dir:
+                from core.checkpoint import CheckpointManager
+                checkpoints = CheckpointManager(checkpoint_dir, filename, checkpoint_interval)
+                state = checkpoints.load() if resume else None
+                if state:
+                    start_after = checkpoints.restore(state, self.env, self.formatter)
+                    print(f"Resuming after line {start_after}")
+
+            last_completed = start_after
+            for line_num, line in enumerate(lines, 1):
+                line = line.strip()
+                if line_num <= start_after or not line or line.startswith('#'):
+                    continue
+
+                print(f"[{line_num}] {line}")
+                started = time.perf_counter()
+                keep_going = self.process_command(line)
+
+                if checkpoints:
+                    status = "error" if self.last_error else "ok"
+                    checkpoints.log_line(line_num, time.perf_counter() - started, status, line)
+                if not keep_going:
+                    break
+                last_completed = line_num
+                if checkpoints:
+                    checkpoints.maybe_save(line_num, self.env, self.formatter)
+
+            if checkpoints:
+                checkpoints.save(last_completed, self.env, self.formatter)
         except FileNotFoundError:
             print(f"Error: File '{filename}' not found")
         except Exception as e:
             print(f"Error reading file: {e}")
+        finally:
+            if checkpoints:
+                checkpoints.close()
 
 def main():
     """Main entry point."""
+    arg_parser = argparse.ArgumentParser(description="SymCalc - SymPy REPL + Science Calculator")
+    arg_parser.add_argument('script', nargs='?', help="script file to run instead of the REPL")
+    arg_parser.add_argument('--checkpoint', metavar='DIR',
+                            help="snapshot progress of the script run into DIR")
+    arg_parser.add_argument('--resume', action='store_true',
+                            help="resume from the last checkpoint in the --checkpoint DIR")
+    arg_parser.add_argument('--checkpoint-interval', type=float, default=60.0, metavar='SECONDS',
+                            help="minimum seconds between checkpoints (default: 60)")
+    arg_parser.add_argument('--debug', action='store_true', help="show tracebacks for errors")
+    options = arg_parser.parse_args()
+
+    if options.resume and not options.checkpoint:
+        arg_parser.error("--resume requires --checkpoint DIR")
+
     calc = SymCalc()
 
-    if len(sys.argv) > 1:
+    if options.script:
         # File mode
-        calc.run_file(sys.argv[1])
+        calc.run_file(options.script, options.checkpoint, options.resume, options.checkpoint_interval)
     else:
         # Interactive mode
         calc.run_repl()
@@ -0,0 +1,73 @@
+"""
+Reading numeric columns from data files.
+"""
+import csv
+import re
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
+from utils.exceptions import DataError
+
+# @path/to/file.csv[column] -- the leading @ and the column are optional
+FILE_REFERENCE_PATTERN = re.compile(r'^@?(?P<path>[^\[\]]+?)\s*(?:\[(?P<column>[^\]]+)\])?$')
+
+
+def parse_file_reference(text: str) -> Tuple[str, Optional[str]]:
+    """Split '@data.csv[col]' into ('data.csv', 'col')."""
+    match = FILE_REFERENCE_PATTERN.match(text.strip())
+    if not match:
+        raise DataError(f"Invalid file reference: '{text}'")
+    column = match.group('column')
+    return match.group('path').strip(), column.strip() if column else None
+
+
+def read_csv_header(path: str) -> List[str]:
+    """Return the column names from the first line of a CSV file."""
+    try:
+        with open(path, 'r', newline='') as f:
+            header = next(csv.reader(f), None)
+    except OSError as e:
+        raise DataError(f"Could not read '{path}': {e}")
+    if not header:
+        raise DataError(f"'{path}' has no header line")
+    return [name.strip() for name in header]
+
+
+def load_csv_columns(path: str, columns: List[str]) -> Dict[str, "np.ndarray"]:
+    """Load the named columns of a CSV file as float arrays."""
+    import numpy as np
+
+    header = read_csv_header(path)
+    missing = [c for c in columns if c not in header]
+    if missing:
+        raise DataError(f"Column(s) {', '.join(missing)} not found in '{path}' (have: {', '.join(header)})")
+
+    indices = [header.index(c) for c in columns]
+    try:
+        data = np.loadtxt(path, delimiter=',', skiprows=1, usecols=indices, dtype=float, ndmin=2)
+    except ValueError as e:
+        raise DataError(f"Non-numeric data in '{path}': {e}")
+    return {name: data[:, k] for k, name in enumerate(columns)}
+
+
+def iter_csv_column_chunks(path: str, column: str, chunk_rows: int = 1_000_000) -> Iterator["np.ndarray"]:
+    """Yield one column of a CSV file as float arrays of up to chunk_rows values."""
+    import numpy as np
+
+    header = read_csv_header(path)
+    if column not in header:
+        raise DataError(f"Column '{column}' not found in '{path}' (have: {', '.join(header)})")
+    index = header.index(column)
+
+    def chunks():
+        with open(path, 'r', newline='') as f:
+            next(f)  # header
+            while True:
+                lines = list(islice(f, chunk_rows))
+                if not lines:
+                    return
+                try:
+                    yield np.loadtxt(lines, delimiter=',', usecols=index, dtype=float, ndmin=1)
+                except ValueError as e:
+                    raise DataError(f"Non-numeric data in column '{column}' of '{path}': {e}")
+
+    return chunks()
@@ -24,3 +24,11 @@ class CommandError(SymCalcError):
 class ConversionError(SymCalcError):
     """Error in unit conversion."""
     pass
+
+class DimensionError(SymCalcError):
+    """Error in dimensional analysis of unit-valued expressions."""
+    pass
+
+class DataError(SymCalcError):
+    """Error reading or interpreting data files."""
+    pass
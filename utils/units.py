@@ -0,0 +1,61 @@
+"""
+Shared pint unit registry and vectorized unit conversion.
+"""
+from functools import lru_cache
+from typing import Tuple
+from utils.exceptions import ConversionError
+
+
+@lru_cache(maxsize=None)
+def get_unit_registry():
+    """Return the process-wide pint UnitRegistry (built once; construction is slow)."""
+    from pint import UnitRegistry
+    return UnitRegistry()
+
+
+@lru_cache(maxsize=None)
+def get_decimal_unit_registry():
+    """A UnitRegistry computing in Decimal, for round-off-free conversion coefficients."""
+    from decimal import Decimal
+    from pint import UnitRegistry
+    return UnitRegistry(non_int_type=Decimal)
+
+
+@lru_cache(maxsize=256)
+def conversion_coefficients(from_unit: str, to_unit: str) -> Tuple[float, float]:
+    """
+    Resolve a conversion to (factor, offset) so that
+    converted = value * factor + offset. Offset is nonzero for
+    temperatures; non-affine conversions (e.g. logarithmic units) raise.
+    The coefficients are worked out in Decimal, so offset units do not
+    pick up float round-off (0 degC is exactly 32 degF).
+    """
+    from decimal import Decimal
+
+    try:
+        zero, one, probe = _convert_points(get_decimal_unit_registry(), Decimal, from_unit, to_unit)
+    except Exception:
+        try:
+            zero, one, probe = _convert_points(get_unit_registry(), float, from_unit, to_unit)
+        except Exception as e:
+            raise ConversionError(f"Cannot convert {from_unit} to {to_unit}: {e}")
+
+    factor, offset = one - zero, zero
+    if abs(probe - (1000 * factor + offset)) > max(1, abs(probe)) / 10**9:
+        raise ConversionError(f"Conversion from {from_unit} to {to_unit} is not linear")
+    return float(factor), float(offset)
+
+
+def _convert_points(registry, number, from_unit: str, to_unit: str):
+    """Converted magnitudes of 0, 1 and 1000 in from_unit."""
+    return tuple(registry.Quantity(number(v), from_unit).to(to_unit).magnitude for v in (0, 1, 1000))
+
+
+def convert_array(values, from_unit: str, to_unit: str):
+    """Convert a NumPy array of magnitudes in a single vectorized operation."""
+    import numpy as np
+    factor, offset = conversion_coefficients(from_unit, to_unit)
+    result = np.multiply(values, factor, dtype=float)
+    if offset:
+        result += offset
+    return result
@@ -50,6 +50,42 @@ class InputValidator:
             return []
         return [item.strip() for item in text.split(',') if item.strip()]
 
+    def split_arguments(self, text: str, separator: str = ',') -> List[str]:
+        """Split on separators that are not nested inside brackets or parentheses."""
+        parts, depth, current = [], 0, []
+        for char in text:
+            if char in '([{':
+                depth += 1
+            elif char in ')]}':
+                depth -= 1
+            if char == separator and depth == 0:
+                parts.append(''.join(current).strip())
+                current = []
+            else:
+                current.append(char)
+        if depth != 0:
+            raise ValidationError(f"Unbalanced brackets in: '{text}'")
+        parts.append(''.join(current).strip())
+        return [p for p in parts if p]
+
+    def split_options(self, parts: List[str], flags=(), keys=()) -> Tuple[List[str], dict]:
+        """
+        Separate trailing options from positional arguments.
+        Bare words in `flags` become True; 'key=value' items with key in `keys`
+        map to their string value. Everything else stays positional.
+        """
+        positional, options = [], {}
+        for part in parts:
+            key, sep, value = part.partition('=')
+            key = key.strip().lower()
+            if not sep and key in flags:
+                options[key] = True
+            elif sep and key in keys:
+                options[key] = value.strip()
+            else:
+                positional.append(part)
+        return positional, options
+
     def parse_equation_system(self, text: str) -> Tuple[List[str], List[str]]:
         """Parse system of equations input format."""
         # Look for quoted equations